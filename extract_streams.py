@@ -1,14 +1,19 @@
 import re
 import os
 import json
+import mmap
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse, parse_qs
-from collections import defaultdict
+import asyncio
+import functools
+import bisect
+import queue
+import collections
+import itertools
+import zlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import aiohttp
 import time
 import sys
 import signal
@@ -36,6 +41,30 @@ except ImportError:
     print("Warning: IPTV_checker.py not found. Stream checking will be limited.")
     IPTV_CHECKER_AVAILABLE = False
 
+# Optional orjson for faster progress serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Hyperscan backend (DFA-based scanning for the SQL dump and content filters)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional uvloop event loop (libuv-based, fewer syscalls per socket event than asyncio's default)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Check for brotli without importing it - aiohttp imports it itself to decode br-encoded responses
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ('brotli', 'brotlicffi'))
+
 # ANSI color codes
 class Colors:
     RESET = '\033[0m'
@@ -64,17 +93,24 @@ STATUS_FILTERED = f"{Colors.YELLOW}[x] Filtered:{Colors.RESET}"
 STATUS_VALID = f"{Colors.GREEN}[+] Valid:{Colors.RESET}"
 STATUS_INVALID = f"{Colors.RED}[-] Invalid:{Colors.RESET}"
 
+# ANSI color sequences, stripped from log file output and skipped when measuring a line's visible width
+ANSI_COLOR_RE = re.compile(r'\033\[[0-9;]+m')
+
 # Logger class to write to both console and file
 class Logger:
+    FLUSH_INTERVAL = 1.0  # seconds between log file flushes
+    BUFFER_SIZE = 64 * 1024  # log file buffer, writes reach the OS in chunks of this size
+    
     def __init__(self, log_file):
         self.log_file = log_file
         self.log_handle = None
         self.console_enabled = True  # Can be disabled during progress display
+        self._last_flush = 0.0
         
     def open(self):
         """Open the log file for appending"""
         try:
-            self.log_handle = open(self.log_file, 'a', encoding='utf-8')
+            self.log_handle = open(self.log_file, 'a', encoding='utf-8', buffering=self.BUFFER_SIZE)
             self.log(f"Log started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         except Exception as e:
             print(f"{Colors.RED}[-] Could not open log file: {e}{Colors.RESET}")
@@ -94,12 +130,22 @@ class Logger:
         # Write to file without colors
         if self.log_handle:
             try:
-                if strip_colors:
+                if strip_colors and '\033' in message:
                     # Remove ANSI color codes for log file
-                    clean_message = re.sub(r'\033\[[0-9;]+m', '', message)
-                else:
-                    clean_message = message
-                self.log_handle.write(clean_message)
+                    message = ANSI_COLOR_RE.sub('', message)
+                self.log_handle.write(message)
+                # Let the file buffer batch writes, flush at most once per interval
+                now = time.monotonic()
+                if now - self._last_flush >= self.FLUSH_INTERVAL:
+                    self.log_handle.flush()
+                    self._last_flush = now
+            except:
+                pass
+    
+    def flush(self):
+        """Flush buffered log output to disk"""
+        if self.log_handle:
+            try:
                 self.log_handle.flush()
             except:
                 pass
@@ -150,12 +196,15 @@ Examples:
     
     # Performance tuning
     parser.add_argument('-w', '--workers', type=int, nargs=2, metavar=('PLAYLIST', 'STREAM'),
-                        default=[10, 30],
-                        help='Number of workers: playlist_workers stream_workers (default: 10 30)')
+                        default=[MAX_PLAYLIST_WORKERS, MAX_STREAM_WORKERS],
+                        help=f'Number of workers: playlist_workers stream_workers '
+                             f'(default: {MAX_PLAYLIST_WORKERS} {MAX_STREAM_WORKERS}, scaled to the CPU count)')
     parser.add_argument('--timeout', type=int, default=10,
                         help='Stream check timeout in seconds (default: 10)')
     parser.add_argument('--save-interval', type=int, default=30,
                         help='Auto-save interval in seconds during stream checking (default: 30)')
+    parser.add_argument('--async-check', action='store_true',
+                        help='Probe stream liveness with concurrent async HEAD requests before ffprobe')
     
     # Filtering options
     parser.add_argument('--no-filters', action='store_true',
@@ -203,43 +252,118 @@ def find_sql_file():
 # Configuration (will be updated by command-line args)
 input_file = find_sql_file() # Auto-detect
 stream_progress_file = "stream_check_progress.json"
+stream_journal_file = "stream_check_progress.jsonl"  # Results appended since the last snapshot
 playlist_progress_file = "playlist_progress.json"
+playlist_journal_file = "playlist_progress.jsonl"
 final_output_file = "IPTV.m3u8"
 log_file = "LOG.txt"
 REPROCESS_PLAYLISTS = False
 REPROCESS_STREAMS = False
 STREAM_TIMEOUT = 10
 SAVE_INTERVAL = 30
-MAX_PLAYLIST_WORKERS = 10
-MAX_STREAM_WORKERS = 30
+M3U_SNAPSHOT_INTERVAL = 5.0  # Minimum seconds between M3U rewrites as playlists complete
+# Worker defaults scale with the machine: checks are I/O-bound threads, so several per core,
+# and never fewer than the former fixed 30 on small machines. Playlist workers only bound
+# concurrent async downloads, so they keep a floor of 10
+CPU_COUNT = os.cpu_count() or 4
+MAX_PLAYLIST_WORKERS = min(32, max(10, CPU_COUNT * 2))
+MAX_STREAM_WORKERS = min(128, max(30, CPU_COUNT * 8))
 ENABLE_FILTERS = True
 INCLUDE_RADIO = False
 INCLUDE_ADULT = False
+ASYNC_STREAM_CHECK = False  # Liveness via aiohttp HEAD instead of check_channel_status
+STREAM_CHECK_CONCURRENCY = 2000
+STREAM_CHECK_PER_HOST = 4  # Probe connections per host - more streams per host wait for a free one
 
-# Regex to match M3U/IPTV playlist URLs
-m3u_pattern = re.compile(
-    r"(https?://[^\s',\)]+(?:"
-    r"type=(?:m3u[_\-]?(?:plus?|plu[ts]?|pl[a-z]*)?|ss(?:iptv)?|smart(?:_iptv)?|enigma|dreambox|ottplayer|webtvlist|gigablue|simple|ts|hls|xml|tvg_plus|adv_[a-z_]+|[a-z0-9_\-]*m3u[a-z0-9_\-]*)"
-    r"|\.m3u8?"
-    r")[^\s',\)]*)", 
-    re.IGNORECASE
-)
+# Marks a URL as an M3U/IPTV playlist: a known type= value or a .m3u/.m3u8 path. Only the
+# distinct prefix of each type is listed - the rest of the URL is matched by the tail anyway
+PLAYLIST_MARK = (rb"type=(?:[a-z0-9_\-]*m3u|ss|smart|enigma|dreambox|ottplayer|webtvlist|gigablue"
+                 rb"|simple|ts|hls|xml|tvg_plus|adv_[a-z_])|\.m3u")
+# Regex to match M3U/IPTV playlist URLs (bytes pattern, scanned over the mmap'd SQL dump)
+m3u_pattern = re.compile(rb"(https?://[^\s',\)]+(?:" + PLAYLIST_MARK + rb")[^\s',\)]*)", re.IGNORECASE)
+# Extracts the playlist type from a matched URL
+type_pattern = re.compile(rb'type=([^&\s\'"]+)', re.IGNORECASE)
 
-lock = threading.Lock()
-stats_lock = threading.Lock()
+def build_hyperscan_db(patterns, flags):
+    """Compile byte patterns into a Hyperscan block-mode database (None if unavailable)"""
+    if not HYPERSCAN_AVAILABLE or not patterns:
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(expressions=patterns, ids=list(range(len(patterns))), flags=[flags] * len(patterns))
+        return db
+    except Exception:
+        # Pattern not supported by Hyperscan - callers fall back to re
+        return None
 
-# Create a session with connection pooling and aggressive timeouts
-session = requests.Session()
-retry_strategy = Retry(total=0, backoff_factor=0, status_forcelist=[429, 500, 502, 503, 504])  # No retries - fail fast
-adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=100, pool_maxsize=100, pool_block=False)
-session.mount("http://", adapter)
-session.mount("https://", adapter)
+def _stop_scan(expr_id, start, end, flags, context):
+    return True  # First match is enough - terminate the scan
+
+def hyperscan_matches(db, text):
+    """Return True if any pattern in db matches text"""
+    try:
+        db.scan(text.encode('utf-8'), match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+m3u_scanner = build_hyperscan_db([m3u_pattern.pattern], hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST) if HYPERSCAN_AVAILABLE else None
+
+def iter_m3u_matches(buf):
+    """Yield m3u_pattern matches over buf (same results as m3u_pattern.finditer)
+    
+    With Hyperscan, the buffer is scanned once in C to find where URLs start, and the
+    re pattern is only run at those offsets to get the exact match span.
+    """
+    if m3u_scanner is None or len(buf) >= 2**32:  # hs_scan takes a 32-bit length
+        yield from m3u_pattern.finditer(buf)
+        return
+    
+    starts = []
+    def on_match(expr_id, start, end, flags, context):
+        # Matches are reported once per end offset; keep each distinct (leftmost) start
+        if not starts or starts[-1] != start:
+            starts.append(start)
+    m3u_scanner.scan(buf, match_event_handler=on_match)
+    
+    last_end = -1
+    for start in starts:
+        if start < last_end:
+            continue
+        match = m3u_pattern.match(buf, start)
+        if match:
+            last_end = match.end()
+            yield match
+
+
+# Playlist downloads run as coroutines on a background event loop (see start_download_loop)
+download_loop = None
+session = None  # aiohttp.ClientSession, created on download_loop
+download_semaphore = None  # Bounds concurrent playlist downloads
+check_session = None  # aiohttp.ClientSession for stream HEAD probes (STREAM_CHECK_PER_HOST connections per host)
+check_semaphore = None  # Bounds concurrent stream probes
+
+# Default request headers, set once on the sessions (M3U text compresses well)
+_HEADERS = {"User-Agent": "VLC/3.0.14 LibVLC/3.0.14",
+            "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"}
+# Extra headers for the ranged GET used on servers that reject HEAD (merged with the session's)
+_RANGE_HEADERS = {"Range": "bytes=0-0"}
+
+def read_timeout(seconds):
+    """aiohttp timeout applied per connect and per read, like a requests timeout
+    
+    A total timeout would also count the time spent waiting for a pooled connection
+    """
+    return aiohttp.ClientTimeout(total=None, sock_connect=seconds, sock_read=seconds)
 
 # Cache for expiry dates per server/credentials to avoid repeated API calls
 expiry_cache = {}
 expiry_cache_lock = threading.Lock()
 
 # Global statistics
+# Counters are only bumped by the main thread as results are collected, so stream
+# workers never contend on a lock; workers make plain stores (current_stream,
+# last_status) and display code reads a dict(global_stats) snapshot
 global_stats = {
     # M3U file stats
     'total_m3u': 0,
@@ -255,9 +379,7 @@ global_stats = {
     'current_stream': '',
     'last_status': '',
     'start_time': time.time(),
-    'stream_checking_time': 0.0,  # Time spent checking streams (excluded from playlist ETA)
-    'first_display': True,
-    'num_lines': 10
+    'stream_checking_time': 0.0  # Time spent checking streams (excluded from playlist ETA)
 }
 
 # Cache terminal width at startup to prevent display jumping
@@ -268,10 +390,15 @@ except:
 # Ensure width is between 78 and 120 (78 is minimum for content to fit)
 TERMINAL_WIDTH = max(78, min(120, TERMINAL_WIDTH))
 
-# For graceful exit
-stream_progress_data = {}
-working_streams_data = []
-processed_playlists_data = set()
+# Seconds between progress frames drawn by the renderer thread
+PROGRESS_REFRESH_INTERVAL = 0.1
+# Latest update_dual_progress arguments, drawn by a background renderer thread
+_progress_state = {'args': None, 'thread': None, 'stop': threading.Event()}
+
+# Run state - rebound by the main block once progress is loaded, read as-is by graceful_exit
+stream_progress = {}
+processed_playlists = {}
+working_streams = []
 
 # Country code mapping
 COUNTRY_CODES = {
@@ -291,72 +418,120 @@ COUNTRY_CODES = {
 
 # Filters - streams to exclude (pre-compiled regex for speed)
 # These will be built dynamically based on command-line flags
-EXCLUDE_PATTERNS = []
+EXCLUDE_PATTERNS = []  # Source patterns of the active filters
+EXCLUDE_RE = None  # All EXCLUDE_PATTERNS compiled into one alternation
+EXCLUDE_SCANNER = None  # Hyperscan database of EXCLUDE_PATTERNS, when available
+# Names the scanner is checked against when compiled (one per pattern, plus near misses)
+FILTER_PARITY_SAMPLES = ('Movie HD', 'Filmes', 'Title (2019)', 'Title [2019]', 'TV Show', 'Temporada 2',
+                         'S01E01', 'S01 E01', '1x01', 'Ep12', '24/7 Music', 'Nonstop', 'VOD', 'Catch up',
+                         'Adult', '+18', 'Radio FM', 'RadioFM', 'Fmx', 'CNN HD', 'ESPN 2', 'Sport_FM')
 
-def build_filter_patterns():
-    """Build filter patterns based on configuration flags"""
-    global EXCLUDE_PATTERNS
-    
-    if not ENABLE_FILTERS:
-        EXCLUDE_PATTERNS = []
-        return
+def scanner_safe(text):
+    """True if the Hyperscan filter scanner matches text exactly like the regex
     
+    Hyperscan only has ASCII word boundaries and whitespace (UCP mode rejects them), while re
+    counts accented letters as word characters and the 0x1c-0x1f separators as whitespace -
+    names with those go to the regex
+    """
+    return text.isascii() and text.isprintable()
+
+@functools.lru_cache(maxsize=8)
+def compile_filters(include_adult, include_radio):
+    """Compile the filter set for a flag combination, returns (patterns, regex, scanner)"""
     patterns = [
         # Movies - including title with year format: "Movie Title (2019)" or "Movie [2019]"
-        re.compile(r'\b(movie|film|cinema|pelicula|filme|cine)\b', re.IGNORECASE),
-        re.compile(r'.+\s*\(\d{4}\)', re.IGNORECASE),  # Matches "Title (Year)" anywhere in name
-        re.compile(r'.+\s*\[\d{4}\]', re.IGNORECASE),  # Matches "Title [Year]" anywhere in name
+        r'\b(movie|film|cinema|pelicula|filme|cine)\b',
+        # A single leading '.' rather than '.+': same matches for search(), but '.+' re-scanned
+        # to the end of the name from every start position when there was no year
+        r'.\s*\(\d{4}\)',  # Matches "Title (Year)" anywhere in name
+        r'.\s*\[\d{4}\]',  # Matches "Title [Year]" anywhere in name
         # Series/Shows - including episode patterns
-        re.compile(r'\b(series|tv\s*show|season|episode|episodio|temporada|capitulo)\b', re.IGNORECASE),
+        r'\b(series|tv\s*show|season|episode|episodio|temporada|capitulo)\b',
         # Episode number patterns: S01E01, 1x01, E01, Ep01, etc.
-        re.compile(r'\b(s\d+e\d+|s\d+\s*e\d+|\d+x\d+|ep?\d+|episode\s*\d+|temporada\s*\d+)\b', re.IGNORECASE),
+        r'\b(s\d+e\d+|s\d+\s*e\d+|\d+x\d+|ep?\d+|episode\s*\d+|temporada\s*\d+)\b',
         # 24/7 channels
-        re.compile(r'\b(24/?7|24h|24hs|24\s*h|24\s*hs|24\s*hour|non-stop|nonstop)\b', re.IGNORECASE),
+        r'\b(24/?7|24h|24hs|24\s*h|24\s*hs|24\s*hour|non-stop|nonstop)\b',
         # VOD/On-demand
-        re.compile(r'\b(vod|on\s*demand|catch\s*up|replay)\b', re.IGNORECASE),
+        r'\b(vod|on\s*demand|catch\s*up|replay)\b',
     ]
     
     # Adult content (unless --include-adult flag is set)
-    if not INCLUDE_ADULT:
-        patterns.append(re.compile(r'\b(xxx|adult|porn|sexy|\+18|18\+|erotic|playboy|hustler)\b', re.IGNORECASE))
+    if not include_adult:
+        patterns.append(r'\b(xxx|adult|porn|sexy|\+18|18\+|erotic|playboy|hustler)\b')
     
     # Radio (unless --include-radio flag is set)
-    if not INCLUDE_RADIO:
-        patterns.append(re.compile(r'\b(radio|fm)\b', re.IGNORECASE))
+    if not include_radio:
+        patterns.append(r'\b(radio|fm)\b')
+    
+    regex = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+    scanner = None
+    if HYPERSCAN_AVAILABLE:
+        scanner = build_hyperscan_db(
+            [p.encode('utf-8') for p in patterns],
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8)
+        # The scanner must filter exactly like the regex - drop it if any sample disagrees
+        if scanner is not None and any(hyperscan_matches(scanner, name) != (regex.search(name) is not None)
+                                       for name in FILTER_PARITY_SAMPLES if scanner_safe(name)):
+            scanner = None
+    return patterns, regex, scanner
+
+def build_filter_patterns():
+    """Build filter patterns based on configuration flags"""
+    global EXCLUDE_PATTERNS, EXCLUDE_RE, EXCLUDE_SCANNER
+    
+    filter_matches.cache_clear()  # Cached results depend on the active patterns
+    if not ENABLE_FILTERS:
+        EXCLUDE_PATTERNS = []
+        EXCLUDE_RE = None
+        EXCLUDE_SCANNER = None
+        return
     
-    EXCLUDE_PATTERNS = patterns
+    # Compiled once per flag combination, rebuilding for the same flags is a cache hit
+    EXCLUDE_PATTERNS, EXCLUDE_RE, EXCLUDE_SCANNER = compile_filters(INCLUDE_ADULT, INCLUDE_RADIO)
+
+@functools.lru_cache(maxsize=200_000)
+def filter_matches(text):
+    """True if any active filter pattern matches text (memoized per field value)"""
+    # Single DFA scan instead of looping over the patterns
+    if EXCLUDE_SCANNER is not None and scanner_safe(text):
+        return hyperscan_matches(EXCLUDE_SCANNER, text)
+    # One search over the combined alternation
+    return EXCLUDE_RE.search(text) is not None
 
 def should_filter_stream(channel_name, group_title):
-    """Fast stream filtering with pre-compiled regex and early exit"""
+    """Fast stream filtering with pre-compiled patterns and early exit"""
     if not ENABLE_FILTERS:
         return False
-    
-    # Check channel name separately for patterns that need exact end-of-string matching
-    for pattern in EXCLUDE_PATTERNS:
-        # Check against channel_name alone (for patterns like "Title (Year)")
-        if pattern.search(channel_name):
-            return True
-        # Also check against group_title
-        if pattern.search(group_title):
-            return True
-    
-    return False
+    # Fields are scanned (and cached) separately: a group title is shared by many channels,
+    # and patterns like '.\s*\(\d{4}\)' would match across a joined "name+group" string
+    return filter_matches(channel_name) or filter_matches(group_title)
+
+# Escape-code length of each message prefix, so prefixed lines that fit skip the regex
+ANSI_PREFIX_OVERHEAD = tuple(
+    (prefix, len(prefix) - len(ANSI_COLOR_RE.sub('', prefix)))
+    for prefix in (MSG_PREFIX_SUCCESS, MSG_PREFIX_ERROR, MSG_PREFIX_WARNING,
+                   MSG_PREFIX_INFO, MSG_PREFIX_M3U, MSG_PREFIX_CHK)
+)
 
 def truncate_line(line, max_width):
     """Truncate a line to max_width visible characters, preserving ANSI color codes"""
-    # Pattern to match ANSI escape sequences
-    ansi_pattern = re.compile(r'\033\[[0-9;]+m')
+    if len(line) <= max_width:
+        return line  # Visible length can't exceed the raw length
     
-    # Split line into parts: text and ANSI codes
-    parts = ansi_pattern.split(line)
-    codes = ansi_pattern.findall(line)
+    for prefix, overhead in ANSI_PREFIX_OVERHEAD:
+        if line.startswith(prefix):
+            if len(line) - overhead <= max_width:
+                return line
+            break
     
     # Calculate visible length
-    visible_len = sum(len(part) for part in parts)
-    
-    if visible_len <= max_width:
+    if len(ANSI_COLOR_RE.sub('', line)) <= max_width:
         return line
     
+    # Split line into parts: text and ANSI codes
+    parts = ANSI_COLOR_RE.split(line)
+    codes = ANSI_COLOR_RE.findall(line)
+    
     # Truncate by removing characters from visible parts
     result = []
     current_len = 0
@@ -380,29 +555,75 @@ def truncate_line(line, max_width):
     return ''.join(result) + Colors.RESET  # Ensure colors are reset
 
 def update_dual_progress(processed_playlists, total_playlists, start_time, current_status="", current_m3u_url="", current_playlist_streams=None, original_playlist_total=None):
-    """Display enhanced progress with two bars - one for playlists, one for streams
+    """Record the state for the progress display; frames are drawn by the renderer thread
     
     Args:
         current_playlist_streams: Optional tuple of (checked, total) for current playlist being processed
         original_playlist_total: Optional int for original total streams before filtering
     """
+    # Single assignment - the renderer always sees a complete argument tuple
+    _progress_state['args'] = (processed_playlists, total_playlists, start_time, current_status,
+                               current_m3u_url, current_playlist_streams, original_playlist_total)
+    if _progress_state['thread'] is None:
+        _progress_state['stop'].clear()
+        _progress_state['thread'] = threading.Thread(target=_progress_renderer, daemon=True)
+        _progress_state['thread'].start()
+
+def _progress_renderer():
+    """Redraw the progress display from the latest state every PROGRESS_REFRESH_INTERVAL"""
+    while not _progress_state['stop'].wait(PROGRESS_REFRESH_INTERVAL):
+        try:
+            render_dual_progress(*_progress_state['args'])
+        except Exception:
+            pass  # Never let the display take down the run
+
+def stop_progress_renderer():
+    """Stop the renderer thread and draw one last frame with the final state"""
+    thread = _progress_state['thread']
+    if thread is None:
+        return
+    _progress_state['stop'].set()
+    thread.join()
+    _progress_state['thread'] = None
+    render_dual_progress(*_progress_state['args'])
+
+@functools.lru_cache(maxsize=4)
+def progress_borders(term_width):
+    """Top, middle and bottom border lines of the progress box (they only depend on the width)"""
+    # Format: ┌─ Label ────...────┐  (total width = term_width)
+    # Components: ┌(1) + label + fill + ┐(1) = term_width
+    top_label = "─ Playlists "
+    mid_label = "─ Streams "
+    
+    # Calculate fill needed: term_width - 2 (corners) - label_length, never negative
+    top_fill = "─" * max(0, term_width - 2 - len(top_label))
+    mid_fill = "─" * max(0, term_width - 2 - len(mid_label))
+    bot_fill = "─" * max(0, term_width - 2)  # Just corners
+    
+    top_border = f"{Colors.BOLD}{Colors.BLUE}┌{top_label}{top_fill}┐{Colors.RESET}"
+    mid_border = f"{Colors.BOLD}{Colors.BLUE}├{mid_label}{mid_fill}┤{Colors.RESET}"
+    bot_border = f"{Colors.BOLD}{Colors.BLUE}└{bot_fill}┘{Colors.RESET}"
+    return top_border[:term_width], mid_border[:term_width], bot_border[:term_width]
+
+def render_dual_progress(processed_playlists, total_playlists, start_time, current_status="", current_m3u_url="", current_playlist_streams=None, original_playlist_total=None):
+    """Display enhanced progress with two bars - one for playlists, one for streams"""
     elapsed = time.time() - start_time
     
     # Use cached terminal width to prevent display jumping
     term_width = TERMINAL_WIDTH
     bar_length = max(20, min(40, term_width - 40))  # Dynamic bar length
     
-    with stats_lock:
-        valid_m3u = global_stats['valid_m3u']
-        invalid_m3u = global_stats['invalid_m3u']
-        total_streams = global_stats['total_streams']
-        checked_streams = global_stats['checked']
-        working = global_stats['working']
-        failed = global_stats['failed']
-        filtered = global_stats['filtered']
-        current_stream = global_stats.get('current_stream', '')
-        current_m3u = global_stats.get('current_m3u', current_m3u_url)
-        stream_checking_time = global_stats.get('stream_checking_time', 0.0)
+    snapshot = dict(global_stats)  # Single C-level copy is atomic under the GIL
+    valid_m3u = snapshot['valid_m3u']
+    invalid_m3u = snapshot['invalid_m3u']
+    total_streams = snapshot['total_streams']
+    checked_streams = snapshot['checked']
+    working = snapshot['working']
+    failed = snapshot['failed']
+    filtered = snapshot['filtered']
+    current_stream = snapshot.get('current_stream', '')
+    current_m3u = snapshot.get('current_m3u', current_m3u_url)
+    stream_checking_time = snapshot.get('stream_checking_time', 0.0)
     
     # Playlist progress bar
     playlist_percent = (processed_playlists / total_playlists * 100) if total_playlists > 0 else 0
@@ -454,31 +675,13 @@ def update_dual_progress(processed_playlists, total_playlists, start_time, curre
         remaining_streams = total_streams - checked_streams
         stream_eta = remaining_streams / stream_rate if stream_rate > 0 and total_streams > 0 else 0
     
-    # Always print exactly 11 lines (8 for bars + 3 for M3U/CHK/status)
+    # Always print exactly 11 lines (8 for bars + 3 for M3U/CHK/status), built into
+    # one buffer so each frame is a single write
     # Move cursor up 11 lines
-    sys.stdout.write('\033[11A')  # Move up 11 lines
-    sys.stdout.flush()  # Ensure cursor movement is applied
-    
-    # Create border lines with exact character counts
-    # Format: ┌─ Label ────...────┐  (total width = term_width)
-    # Components: ┌(1) + label + fill + ┐(1) = term_width
-    
-    top_label = "─ Playlists "
-    mid_label = "─ Streams "
-    
-    # Calculate fill needed: term_width - 2 (corners) - label_length
-    top_fill_len = term_width - 2 - len(top_label)
-    mid_fill_len = term_width - 2 - len(mid_label)
-    bot_fill_len = term_width - 2  # Just corners
+    frame = ['\033[11A']
     
-    # Ensure fills are non-negative
-    top_fill = "─" * max(0, top_fill_len)
-    mid_fill = "─" * max(0, mid_fill_len)
-    bot_fill = "─" * max(0, bot_fill_len)
-    
-    top_border = f"{Colors.BOLD}{Colors.BLUE}┌{top_label}{top_fill}┐{Colors.RESET}"
-    mid_border = f"{Colors.BOLD}{Colors.BLUE}├{mid_label}{mid_fill}┤{Colors.RESET}"
-    bot_border = f"{Colors.BOLD}{Colors.BLUE}└{bot_fill}┘{Colors.RESET}"
+    # Border lines with exact character counts, built once per terminal width
+    top_border, mid_border, bot_border = progress_borders(term_width)
     
     # Build content lines
     line1 = f"{Colors.BLUE}│{Colors.RESET} {Colors.CYAN}{playlist_bar}{Colors.RESET} {Colors.WHITE}{playlist_percent:>5.1f}%{Colors.RESET} {Colors.GRAY}({processed_playlists:,}/{total_playlists:,}){Colors.RESET}"
@@ -497,14 +700,14 @@ def update_dual_progress(processed_playlists, total_playlists, start_time, curre
     max_visible = term_width
     
     # Print playlist progress (clear each line to handle terminal resize)
-    print(f"\033[2K\033[0G{top_border[:term_width]}")
-    print(f"\033[2K\033[0G{truncate_line(line1, max_visible)}")
-    print(f"\033[2K\033[0G{truncate_line(line2, max_visible)}")
-    print(f"\033[2K\033[0G{mid_border[:term_width]}")
-    print(f"\033[2K\033[0G{truncate_line(line3, max_visible)}")
-    print(f"\033[2K\033[0G{truncate_line(line4, max_visible)}")
-    print(f"\033[2K\033[0G{truncate_line(line5, max_visible)}")
-    print(f"\033[2K\033[0G{bot_border[:term_width]}")
+    frame.append(f"\033[2K\033[0G{top_border}\n")
+    frame.append(f"\033[2K\033[0G{truncate_line(line1, max_visible)}\n")
+    frame.append(f"\033[2K\033[0G{truncate_line(line2, max_visible)}\n")
+    frame.append(f"\033[2K\033[0G{mid_border}\n")
+    frame.append(f"\033[2K\033[0G{truncate_line(line3, max_visible)}\n")
+    frame.append(f"\033[2K\033[0G{truncate_line(line4, max_visible)}\n")
+    frame.append(f"\033[2K\033[0G{truncate_line(line5, max_visible)}\n")
+    frame.append(f"\033[2K\033[0G{bot_border}\n")
     
     # Always print 3 more lines (M3U, CHK, status) - use empty lines if not available
     # Adapt URL display to terminal width
@@ -517,27 +720,26 @@ def update_dual_progress(processed_playlists, total_playlists, start_time, curre
             # Show beginning and end of URL
             half = max_url_len // 2 - 2
             m3u_display = current_m3u[:half] + "..." + current_m3u[-half:]
-        print(f"\033[2K\033[0G{Colors.GRAY}[M3U] {m3u_display}{Colors.RESET}")
+        frame.append(f"\033[2K\033[0G{Colors.GRAY}[M3U] {m3u_display}{Colors.RESET}\n")
     else:
-        print("\033[2K\033[0G")  # Clear line and print empty
+        frame.append("\033[2K\033[0G\n")  # Clear line and print empty
     
     if current_stream:
         stream_display = current_stream
         if len(stream_display) > max_url_len:
             half = max_url_len // 2 - 2
             stream_display = current_stream[:half] + "..." + current_stream[-half:]
-        print(f"\033[2K\033[0G{Colors.GRAY}[CHK] {stream_display}{Colors.RESET}")
+        frame.append(f"\033[2K\033[0G{Colors.GRAY}[CHK] {stream_display}{Colors.RESET}\n")
     else:
-        print("\033[2K\033[0G")  # Clear line and print empty
+        frame.append("\033[2K\033[0G\n")  # Clear line and print empty
     
     if current_status:
-        print(f"\033[2K\033[0G{current_status[:term_width-2]}")  # Limit to terminal width
+        frame.append(f"\033[2K\033[0G{current_status[:term_width-2]}\n")  # Limit to terminal width
     else:
-        print("\033[2K\033[0G")  # Clear line and print empty
+        frame.append("\033[2K\033[0G\n")  # Clear line and print empty
     
+    sys.stdout.write(''.join(frame))
     sys.stdout.flush()  # Ensure all output is written immediately
-    
-    sys.stdout.flush()
 
 def format_time(seconds):
     if seconds < 0:
@@ -547,124 +749,144 @@ def format_time(seconds):
     secs = int(seconds % 60)
     return f"{hours}:{minutes:02d}:{secs:02d}"
 
+_timestamp_cache = (0, '')  # (epoch second, formatted), replaced as one tuple
+
+def timestamp_now():
+    """Local 'YYYY-MM-DD HH:MM:SS' timestamp, formatted once per wall-clock second"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = _timestamp_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return cached[1]
+
+# Keywords used by extract_country_code, in priority order: full country names and
+# common patterns are checked first to prevent false matches like "AR" in "PARAMOUNT"
+# or "FR" in "FREEFORM". Keywords of 3 characters or less must be standalone words.
+COUNTRY_KEYWORDS = [
+    ('US', ['USA', 'UNITED STATES', 'AMERICA']),
+    ('UK', ['UNITED KINGDOM', 'UK', 'GB', 'ENGLAND', 'BRITISH']),
+    ('INT', ['INTERNATIONAL', 'INT']),
+    ('AR', ['ARGENTINA', 'AR']),
+    ('BR', ['BRAZIL', 'BRASIL', 'BR']),
+    ('CA', ['CANADA', 'CA']),
+    ('DE', ['GERMANY', 'DEUTSCHLAND', 'DE']),
+    ('ES', ['SPAIN', 'ESPAÑA', 'ES']),
+    ('FR', ['FRANCE', 'FR']),
+    ('IT', ['ITALY', 'ITALIA', 'IT']),
+    ('MX', ['MEXICO', 'MX']),
+    ('PT', ['PORTUGAL', 'PT']),
+]
+COUNTRY_PRIORITY = [code for code, _ in COUNTRY_KEYWORDS]
+COUNTRY_TOKEN_TO_CODE = {kw: code for code, kws in COUNTRY_KEYWORDS for kw in kws}
+# One scan over the space-padded text finds every keyword present; the lookahead lets
+# matches overlap. Short codes (<= 3 chars) only count as whole words: ' KW '
+COUNTRY_RE = re.compile('(?=(?:(' + '|'.join(
+    re.escape(kw) for kw in sorted(COUNTRY_TOKEN_TO_CODE, key=len, reverse=True) if len(kw) > 3
+) + ')| (' + '|'.join(
+    re.escape(kw) for kw in sorted(COUNTRY_TOKEN_TO_CODE, key=len, reverse=True) if len(kw) <= 3
+) + ') ))')
+
+@functools.lru_cache(maxsize=200_000)
 def extract_country_code(group_title, channel_name):
-    """Fast country extraction with priority for specific matches"""
-    text = f"{group_title} {channel_name}".upper()
-    
-    # Priority order: check for full country names and common patterns first
-    # This prevents false matches like "AR" in "PARAMOUNT" or "FR" in "FREEFORM"
-    priority_checks = [
-        ('US', ['USA', 'UNITED STATES', 'AMERICA']),
-        ('UK', ['UNITED KINGDOM', 'UK', 'GB', 'ENGLAND', 'BRITISH']),
-        ('INT', ['INTERNATIONAL', 'INT']),
-    ]
-    
-    # Check priority patterns first (USA, UK, etc.)
-    for code, keywords in priority_checks:
-        for keyword in keywords:
-            # Use word boundary check for short codes
-            if len(keyword) <= 3:
-                # Check if it's a standalone word (not part of another word)
-                if f' {keyword} ' in f' {text} ' or text.startswith(keyword + ' ') or text.endswith(' ' + keyword):
-                    return code
-            else:
-                # For longer keywords, simple substring match is fine
-                if keyword in text:
-                    return code
-    
-    # Then check other countries
-    other_countries = {
-        'AR': ['ARGENTINA', 'AR'],
-        'BR': ['BRAZIL', 'BRASIL', 'BR'],
-        'CA': ['CANADA', 'CA'],
-        'DE': ['GERMANY', 'DEUTSCHLAND', 'DE'],
-        'ES': ['SPAIN', 'ESPAÑA', 'ES'],
-        'FR': ['FRANCE', 'FR'],
-        'IT': ['ITALY', 'ITALIA', 'IT'],
-        'MX': ['MEXICO', 'MX'],
-        'PT': ['PORTUGAL', 'PT'],
-    }
+    """Fast country extraction with priority for specific matches (memoized)"""
+    padded = f" {group_title} {channel_name} ".upper()
     
-    for code, keywords in other_countries.items():
-        for keyword in keywords:
-            # Use word boundary check for short codes (2-3 chars)
-            if len(keyword) <= 3:
-                if f' {keyword} ' in f' {text} ' or text.startswith(keyword + ' ') or text.endswith(' ' + keyword):
-                    return code
-            else:
-                if keyword in text:
-                    return code
+    found = {COUNTRY_TOKEN_TO_CODE[m.group(1) or m.group(2)] for m in COUNTRY_RE.finditer(padded)}
+    if found:
+        for code in COUNTRY_PRIORITY:
+            if code in found:
+                return code
     
     return 'Unknown'
 
+# Country suffixes (e.g. "channel.br") and prefixes (e.g. "br#channel", "br-channel") in tvg-ids
+TVG_ID_SUFFIX_COUNTRIES = {'BR', 'US', 'UK', 'CA', 'AR', 'MX', 'ES', 'FR',
+                           'DE', 'IT', 'PT', 'CL', 'CO', 'PE', 'VE', 'EC'}
+TVG_ID_PREFIX_RE = re.compile(r'(br|us|uk|ca|ar|mx|es|fr|de|it|pt|cl)[#_-]', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=200_000)
 def extract_country_from_tvg_id(tvg_id):
     """Extract country code from tvg_id like 'CNNBrasil.br' -> 'BR'"""
     if not tvg_id:
         return None
     
-    tvg_id_lower = tvg_id.lower()
-    
     # Check for country code after a dot (e.g., "channel.br", "channel.us")
     if '.' in tvg_id:
-        parts = tvg_id.split('.')
-        potential_country = parts[-1].upper()
-        
-        # Map common TLDs to country codes
-        country_map = {
-            'BR': 'BR', 'US': 'US', 'UK': 'UK', 'CA': 'CA',
-            'AR': 'AR', 'MX': 'MX', 'ES': 'ES', 'FR': 'FR',
-            'DE': 'DE', 'IT': 'IT', 'PT': 'PT', 'CL': 'CL',
-            'CO': 'CO', 'PE': 'PE', 'VE': 'VE', 'EC': 'EC',
-        }
-        
-        if potential_country in country_map:
-            return country_map[potential_country]
+        potential_country = tvg_id.rpartition('.')[2].upper()
+        if potential_country in TVG_ID_SUFFIX_COUNTRIES:
+            return potential_country
     
     # Check for country code prefix pattern (e.g., "br#channel-name", "br-channel")
-    country_prefixes = {
-        'br': 'BR', 'us': 'US', 'uk': 'UK', 'ca': 'CA',
-        'ar': 'AR', 'mx': 'MX', 'es': 'ES', 'fr': 'FR',
-        'de': 'DE', 'it': 'IT', 'pt': 'PT', 'cl': 'CL',
-    }
-    
-    for prefix, country_code in country_prefixes.items():
-        if tvg_id_lower.startswith(f'{prefix}#') or tvg_id_lower.startswith(f'{prefix}-') or tvg_id_lower.startswith(f'{prefix}_'):
-            return country_code
+    match = TVG_ID_PREFIX_RE.match(tvg_id)
+    if match:
+        return match.group(1).upper()
     
     return None
 
+def _fast_attr(line, key):
+    """Value of the first key="..." attribute in an EXTINF line ('' if absent)"""
+    i = line.find(key)
+    if i < 0:
+        return ''
+    i += len(key)
+    j = line.find('"', i)
+    return line[i:j] if j >= 0 else ''
+
+# Fields that repeat across thousands of streams - interned so every stream shares one copy
+INTERNED_INFO_FIELDS = ('tvg_id', 'tvg_name', 'tvg_logo', 'group_title', 'channel_name')
+INTERNED_RESULT_FIELDS = ('channel_name', 'group_title', 'country')
+
+@functools.lru_cache(maxsize=200_000)
+def parse_channel_fields(extinf_line):
+    """Interned (tvg_id, tvg_name, tvg_logo, group_title, channel_name) of an EXTINF line (memoized)"""
+    idx = extinf_line.rfind(',')
+    return (sys.intern(_fast_attr(extinf_line, 'tvg-id="')),
+            sys.intern(_fast_attr(extinf_line, 'tvg-name="')),
+            sys.intern(_fast_attr(extinf_line, 'tvg-logo="')),
+            sys.intern(_fast_attr(extinf_line, 'group-title="')),
+            sys.intern(extinf_line[idx + 1:].strip()) if idx >= 0 else '')
+
 def parse_channel_info(extinf_line):
-    info = {
-        'tvg_id': '',
-        'tvg_name': '',
-        'tvg_logo': '',
-        'group_title': '',
-        'channel_name': '',
+    # Panels serve the same playlist to every account, so identical EXTINF lines repeat
+    # across playlists - the fields are cached, the dict is fresh since callers mutate it
+    tvg_id, tvg_name, tvg_logo, group_title, channel_name = parse_channel_fields(extinf_line)
+    return {
+        'tvg_id': tvg_id,
+        'tvg_name': tvg_name,
+        'tvg_logo': tvg_logo,
+        'group_title': group_title,
+        'channel_name': channel_name,
         'expiry_date': None  # Will be populated if found in URL
     }
-    tvg_id_match = re.search(r'tvg-id="([^"]*)"', extinf_line)
-    if tvg_id_match:
-        info['tvg_id'] = tvg_id_match.group(1)
-    tvg_name_match = re.search(r'tvg-name="([^"]*)"', extinf_line)
-    if tvg_name_match:
-        info['tvg_name'] = tvg_name_match.group(1)
-    tvg_logo_match = re.search(r'tvg-logo="([^"]*)"', extinf_line)
-    if tvg_logo_match:
-        info['tvg_logo'] = tvg_logo_match.group(1)
-    group_match = re.search(r'group-title="([^"]*)"', extinf_line)
-    if group_match:
-        info['group_title'] = group_match.group(1)
-    if ',' in extinf_line:
-        info['channel_name'] = extinf_line.rsplit(',', 1)[1].strip()
-    return info
 
+def intern_stream_fields(entry):
+    """Intern the repeated string fields of a loaded progress entry in place"""
+    for field in INTERNED_RESULT_FIELDS:
+        value = entry.get(field)
+        if type(value) is str:
+            entry[field] = sys.intern(value)
+    info = entry.get('info')
+    if isinstance(info, dict):
+        for field in INTERNED_INFO_FIELDS:
+            value = info.get(field)
+            if type(value) is str:
+                info[field] = sys.intern(value)
+
+BITRATE_RE = re.compile(r'(\d+)')
+
+@functools.lru_cache(maxsize=8192)
 def extract_bitrate_value(bitrate_str):
     if not bitrate_str or bitrate_str == 'Unknown' or bitrate_str == 'N/A':
         return 0
-    match = re.search(r'(\d+)', bitrate_str)
+    # Usual form is "<digits> kbps" - skip the regex when the first word is the number
+    head = bitrate_str.partition(' ')[0]
+    if head.isdecimal():
+        return int(head)
+    match = BITRATE_RE.search(bitrate_str)
     return int(match.group(1)) if match else 0
 
-def extract_expiry_from_url(url):
+async def extract_expiry_from_url(url):
     """Extract expiry date from stream URL by querying the IPTV panel API (cached)"""
     try:
         # First check for expiry in URL parameters (some services use this)
@@ -705,37 +927,37 @@ def extract_expiry_from_url(url):
             # Query the player API endpoint with very short timeout
             api_url = f"{server}/player_api.php?username={username}&password={password}"
             try:
-                response = session.get(api_url, timeout=1.5)  # Fast timeout
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check for expiry in user_info
-                    if 'user_info' in data:
-                        user_info = data['user_info']
+                async with session.get(api_url, timeout=read_timeout(1.5)) as response:  # Fast timeout
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        
+                        # Check for expiry in user_info
+                        if 'user_info' in data:
+                            user_info = data['user_info']
                         
-                        # exp_date is typically a Unix timestamp
-                        if 'exp_date' in user_info and user_info['exp_date']:
-                            exp_timestamp = int(user_info['exp_date'])
-                            if exp_timestamp > 0 and 946684800 <= exp_timestamp <= 4102444800:
-                                expiry_dt = datetime.fromtimestamp(exp_timestamp)
-                                # Cache the result
-                                with expiry_cache_lock:
-                                    expiry_cache[cache_key] = expiry_dt
-                                return expiry_dt
+                            # exp_date is typically a Unix timestamp
+                            if 'exp_date' in user_info and user_info['exp_date']:
+                                exp_timestamp = int(user_info['exp_date'])
+                                if exp_timestamp > 0 and 946684800 <= exp_timestamp <= 4102444800:
+                                    expiry_dt = datetime.fromtimestamp(exp_timestamp)
+                                    # Cache the result
+                                    with expiry_cache_lock:
+                                        expiry_cache[cache_key] = expiry_dt
+                                    return expiry_dt
                         
-                        # Some panels use 'exp' instead
-                        if 'exp' in user_info and user_info['exp']:
-                            exp_timestamp = int(user_info['exp'])
-                            if exp_timestamp > 0 and 946684800 <= exp_timestamp <= 4102444800:
-                                expiry_dt = datetime.fromtimestamp(exp_timestamp)
-                                # Cache the result
-                                with expiry_cache_lock:
-                                    expiry_cache[cache_key] = expiry_dt
-                                return expiry_dt
+                            # Some panels use 'exp' instead
+                            if 'exp' in user_info and user_info['exp']:
+                                exp_timestamp = int(user_info['exp'])
+                                if exp_timestamp > 0 and 946684800 <= exp_timestamp <= 4102444800:
+                                    expiry_dt = datetime.fromtimestamp(exp_timestamp)
+                                    # Cache the result
+                                    with expiry_cache_lock:
+                                        expiry_cache[cache_key] = expiry_dt
+                                    return expiry_dt
                     
-                    # Cache null result to avoid repeated failed queries
-                    with expiry_cache_lock:
-                        expiry_cache[cache_key] = None
+                        # Cache null result to avoid repeated failed queries
+                        with expiry_cache_lock:
+                            expiry_cache[cache_key] = None
             except Exception:
                 # Cache null result to avoid repeated failed queries
                 with expiry_cache_lock:
@@ -745,109 +967,45 @@ def extract_expiry_from_url(url):
     except Exception:
         return None
 
-def update_playlist_progress(current, total, start_time, streams_found):
-    """Display progress bar for playlist parsing"""
-    with stats_lock:
-        valid_m3u = global_stats['valid_m3u']
-        invalid_m3u = global_stats['invalid_m3u']
-        current_m3u = global_stats['current_m3u']
-    
-    percent = (current / total * 100) if total > 0 else 0
-    bar_length = 50
-    filled = int(bar_length * current / total) if total > 0 else 0
-    bar = '█' * filled + '░' * (bar_length - filled)
-    elapsed = time.time() - start_time
-    rate = current / elapsed if elapsed > 0 else 0
-    remaining = total - current
-    eta = remaining / rate if rate > 0 else 0
-    
-    # Clear previous lines and print new status
-    sys.stdout.write('\033[2K\r')  # Clear current line
-    print(f"{Colors.BOLD}{Colors.BLUE}Downloading M3U Files:{Colors.RESET}")
-    print(f"{Colors.CYAN}{bar}{Colors.RESET} {Colors.WHITE}{percent:.1f}%{Colors.RESET} ({current}/{total})")
-    print(f"{Colors.GREEN}[+] Valid: {valid_m3u}{Colors.RESET}  {Colors.RED}[-] Invalid: {invalid_m3u}{Colors.RESET}  {Colors.BLUE}Streams Found:{Colors.RESET} {Colors.GREEN}{streams_found:,}{Colors.RESET}")
-    print(f"{Colors.BLUE}Current M3U:{Colors.RESET} {Colors.GRAY}{current_m3u[:60]}{Colors.RESET}")
-    print(f"{Colors.BLUE}ETA:{Colors.RESET} {Colors.CYAN}{format_time(eta)}{Colors.RESET}")
-    # Move cursor up 5 lines for next update
-    if current < total:
-        sys.stdout.write('\033[5A')
-    sys.stdout.flush()
-
-def update_stream_progress_display():
-    with stats_lock:
-        total = global_stats['total_streams']
-        checked = global_stats['checked']
-        working = global_stats['working']
-        failed = global_stats['failed']
-        filtered = global_stats['filtered']
-        current_stream = global_stats['current_stream']
-        last_status = global_stats['last_status']
-        elapsed = time.time() - global_stats['start_time']
-        first_display = global_stats['first_display']
-        num_lines = global_stats['num_lines']
-    if total == 0:
-        return
-    percent = (checked / total * 100) if total > 0 else 0
-    rate = checked / elapsed if elapsed > 0 else 0
-    remaining = total - checked
-    eta = remaining / rate if rate > 0 else 0
-    bar_length = 50
-    filled = int(bar_length * checked / total) if total > 0 else 0
-    bar = '█' * filled + '░' * (bar_length - filled)
-    if not first_display:
-        sys.stdout.write(f'\033[{num_lines}A')
-        sys.stdout.write('\033[J')
-    status_color = Colors.GREEN if last_status == 'working' else Colors.RED if last_status == 'failed' else Colors.YELLOW
-    print(f"{Colors.BOLD}{Colors.BLUE}Checking Streams:{Colors.RESET}")
-    print(f"{Colors.CYAN}{bar}{Colors.RESET} {Colors.WHITE}{percent:.1f}%{Colors.RESET} ({checked:,}/{total:,})")
-    print(f"{Colors.GREEN}[+] Working: {working:,}{Colors.RESET}  {Colors.RED}[-] Failed: {failed:,}{Colors.RESET}  {Colors.YELLOW}[x] Filtered: {filtered:,}{Colors.RESET}")
-    print(f"{Colors.BLUE}Speed:{Colors.RESET} {Colors.MAGENTA}{rate:.1f} streams/s{Colors.RESET}  {Colors.BLUE}ETA:{Colors.RESET} {Colors.CYAN}{format_time(eta)}{Colors.RESET}")
-    print(f"{Colors.BLUE}Time:{Colors.RESET} {Colors.CYAN}{format_time(elapsed)}{Colors.RESET}")
-    print(f"{Colors.BLUE}Current:{Colors.RESET} {status_color}{current_stream[:65]}{Colors.RESET}")
-    print()
-    sys.stdout.flush()
-    with stats_lock:
-        global_stats['first_display'] = False
-
 def extract_urls_from_sql():
     urls = []
     stats = {'total_matches': 0, 'by_type': {}}
     print(f"{Colors.BOLD}{Colors.BLUE}→ Extracting M3U URLs from SQL database...{Colors.RESET}")
     
-    line_count = 0
     last_update = time.time()
     
-    with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            line_count += 1
-            
-            # Update progress every 0.5 seconds
-            current_time = time.time()
-            if current_time - last_update >= 0.5:
-                sys.stdout.write(f'\r{Colors.CYAN}  Processing... Lines: {line_count:,}  URLs found: {len(urls):,}{Colors.RESET}')
-                sys.stdout.flush()
-                last_update = current_time
-            
-            matches = m3u_pattern.findall(line)
-            for m in matches:
+    # Scan the whole dump in one pass over a memory map instead of line by line
+    with open(input_file, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size > 0 else b''
+        try:
+            for match in iter_m3u_matches(buf):
                 stats['total_matches'] += 1
-                type_match = re.search(r'type=([^&\s\'"]+)', m, re.IGNORECASE)
+                # Update progress every 0.5 seconds (the clock is only read every 1024 matches)
+                if not stats['total_matches'] & 0x3FF:
+                    current_time = time.time()
+                    if current_time - last_update >= 0.5:
+                        percent = match.start() / file_size * 100
+                        sys.stdout.write(f'\r{Colors.CYAN}  Processing... {percent:.1f}%  URLs found: {len(urls):,}{Colors.RESET}')
+                        sys.stdout.flush()
+                        last_update = current_time
+                
+                m = match.group(0)
+                type_match = type_pattern.search(m)
                 if type_match:
-                    ptype = type_match.group(1).lower()
+                    ptype = type_match.group(1).lower().decode('ascii', 'ignore')
                     stats['by_type'][ptype] = stats['by_type'].get(ptype, 0) + 1
-                elif '.m3u' in m.lower():
+                elif b'.m3u' in m.lower():
                     stats['by_type']['direct_m3u'] = stats['by_type'].get('direct_m3u', 0) + 1
-                urls.append(m)
+                urls.append(m.decode('utf-8', 'ignore'))
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
     
     # Clear progress line
     sys.stdout.write('\r' + ' ' * 80 + '\r')
     sys.stdout.flush()
-    seen = set()
-    uniq = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            uniq.append(u)
+    uniq = list(dict.fromkeys(urls))  # Order-preserving dedup
     print(f"\n{Colors.BOLD}{Colors.CYAN}=== URL Extraction Statistics ==={Colors.RESET}")
     print(f"{Colors.GREEN}[+] Total URLs found: {stats['total_matches']}{Colors.RESET}")
     print(f"{Colors.GREEN}[+] Unique URLs: {len(uniq)}{Colors.RESET}")
@@ -858,117 +1016,155 @@ def extract_urls_from_sql():
     print(f"{Colors.CYAN}{'═' * 35}{Colors.RESET}\n")
     return uniq
 
-def download_and_parse_playlist(url, timeout=2, progress_callback=None):
+# Playlists served as .m3u.gz files (gzip body, not Content-Encoding) are inflated before parsing
+GZIP_MAGIC = b'\x1f\x8b'
+GZIP_WBITS = zlib.MAX_WBITS | 16
+
+async def download_and_parse_playlist(url, timeout=2, progress_callback=None):
     try:
-        headers = {"User-Agent": "VLC/3.0.14 LibVLC/3.0.14"}
-        
-        # Download with progress tracking
-        response = session.get(url, timeout=timeout, headers=headers, stream=True)
-        if response.status_code != 200:
-            return []
-        
-        # Get total size if available
-        total_size = int(response.headers.get('content-length', 0))
-        
-        # Download content in chunks
-        content_parts = []
-        downloaded = 0
-        
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                content_parts.append(chunk)
-                downloaded += len(chunk)
+        # Download with progress tracking (session sends _HEADERS)
+        async with session.get(url, timeout=read_timeout(timeout)) as response:
+            if response.status != 200:
+                return []
+            
+            if progress_callback is None:
+                content = await response.read()
+                if content[:2] == GZIP_MAGIC:
+                    content = zlib.decompressobj(GZIP_WBITS).decompress(content)
+            else:
+                # Get total size if available
+                total_size = response.content_length or 0
                 
-                # Call progress callback if provided
-                if progress_callback and total_size > 0:
-                    progress = (downloaded / total_size) * 100
-                    progress_callback(progress, downloaded, total_size)
-        
-        # Combine all chunks
-        content = b''.join(content_parts).decode('utf-8', errors='ignore')
+                # Download content in chunks, inflating gzipped playlist files as they arrive.
+                # Chunks are appended to one bytearray (parsed as-is) - no list of parts to join
+                content = bytearray()
+                downloaded = 0
+                inflater = None
+                
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    if downloaded == 0 and chunk[:2] == GZIP_MAGIC:
+                        inflater = zlib.decompressobj(GZIP_WBITS)
+                    downloaded += len(chunk)
+                    content += inflater.decompress(chunk) if inflater else chunk
+                    
+                    # Call progress callback if provided
+                    if total_size > 0:
+                        progress = (downloaded / total_size) * 100
+                        progress_callback(progress, downloaded, total_size)
         
-        # Parse the M3U content - optimized parsing
-        lines = content.split('\n')
+        # Parse the M3U content from bytes - only the kept EXTINF/URL lines are decoded
+        lines = iter(content.splitlines())
         streams = []
-        i = 0
-        line_count = len(lines)
         
         # Extract expiry once for the entire playlist (not per stream)
         playlist_expiry = None
         first_url_checked = False
         
-        while i < line_count:
-            line = lines[i].strip()
+        for raw_line in lines:
             # Fast check: does line start with #EXTINF?
-            if line.startswith('#EXTINF'):
-                i += 1
-                # Check if next line exists and is not a comment
-                if i < line_count:
-                    stream_url = lines[i].strip()
-                    if stream_url and not stream_url.startswith('#'):
-                        info = parse_channel_info(line)
-                        
-                        # Only extract expiry from the first stream URL
-                        if not first_url_checked:
-                            playlist_expiry = extract_expiry_from_url(stream_url)
-                            first_url_checked = True
-                        
-                        # Apply playlist expiry to all streams
-                        if playlist_expiry:
-                            info['expiry_date'] = playlist_expiry
-                        
-                        streams.append({'extinf': line, 'url': stream_url, 'info': info})
-                i += 1
-            else:
-                i += 1
+            if not raw_line.strip().startswith(b'#EXTINF'):
+                continue
+            # The next line must exist and not be a comment
+            stream_url = next(lines, b'').decode('utf-8', errors='ignore').strip()
+            if stream_url and not stream_url.startswith('#'):
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                info = parse_channel_info(line)
+                
+                # Only extract expiry from the first stream URL
+                if not first_url_checked:
+                    playlist_expiry = await extract_expiry_from_url(stream_url)
+                    first_url_checked = True
+                
+                # Apply playlist expiry to all streams
+                if playlist_expiry:
+                    info['expiry_date'] = playlist_expiry
+                
+                streams.append({'extinf': line, 'url': stream_url, 'info': info})
         
         return streams
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         # Timeout - skip this playlist
         return []
     except Exception:
         # Silently ignore other errors
         return []
 
-def process_playlist_worker(url, idx, total, stream_progress):
-    """Download a playlist and return its streams for checking"""
-    # Update current M3U
-    with stats_lock:
-        global_stats['current_m3u'] = url
-    
-    # Download and parse playlist
-    try:
-        streams = download_and_parse_playlist(url)
-    except Exception:
-        streams = []
-    
-    # Update M3U stats
-    with stats_lock:
-        global_stats['total_streams'] += len(streams)
-        if len(streams) > 0:
-            global_stats['valid_m3u'] += 1
-        else:
-            global_stats['invalid_m3u'] += 1
-    
-    return streams  # Return streams for parallel checking
+async def download_playlist_wrapper(url, idx, total):
+    """Coroutine for downloading and parsing a playlist concurrently"""
+    async with download_semaphore:
+        download_start = time.time()
+        
+        try:
+            # Download and parse the playlist
+            streams = await download_and_parse_playlist(url, progress_callback=None)
+            download_time = time.time() - download_start
+            
+            return streams, download_time
+            
+        except Exception:
+            download_time = time.time() - download_start
+            return [], download_time
+
+async def open_download_session():
+    """Create the shared aiohttp session and download semaphore on the running loop"""
+    global session, download_semaphore
+    download_semaphore = asyncio.Semaphore(MAX_PLAYLIST_WORKERS)
+    # No per-host limit: download_semaphore already bounds the downloads, and playlists of
+    # one panel must not queue behind each other (the old requests pool never blocked either)
+    connector = aiohttp.TCPConnector(limit=500, limit_per_host=0, ttl_dns_cache=300, ssl=False)
+    session = aiohttp.ClientSession(connector=connector, timeout=read_timeout(2), headers=_HEADERS)
 
-def download_playlist_wrapper(url, idx, total):
-    """Wrapper function for downloading and parsing a playlist in parallel"""
-    download_start = time.time()
+async def open_check_session():
+    """Create the stream probe session - a few connections per host, panels often cap them per account"""
+    global check_session, check_semaphore
+    check_semaphore = asyncio.Semaphore(STREAM_CHECK_CONCURRENCY)
+    # Keep idle connections around long enough for the next stream on the same host to reuse them
+    connector = aiohttp.TCPConnector(limit=STREAM_CHECK_CONCURRENCY, limit_per_host=STREAM_CHECK_PER_HOST,
+                                     ttl_dns_cache=300, keepalive_timeout=30, ssl=False)
+    check_session = aiohttp.ClientSession(connector=connector, headers=_HEADERS)
+
+async def check_alive(url):
+    """HEAD a stream URL (following redirects) and report whether it answers below 400
     
-    try:
-        # Download and parse the playlist
-        streams = download_and_parse_playlist(url, progress_callback=None)
-        download_time = time.time() - download_start
-        
-        return streams, download_time
-        
-    except Exception:
-        download_time = time.time() - download_start
-        return [], download_time
+    Servers that reject HEAD are asked for a single byte with a ranged GET instead. Returns None
+    when the probe gets no answer, so the stream goes to the full check rather than being failed
+    """
+    async with check_semaphore:
+        try:
+            # Per connect/read, so probes queued behind the same server don't time out unsent
+            timeout = read_timeout(STREAM_TIMEOUT)
+            async with check_session.head(url, timeout=timeout, allow_redirects=True) as r:
+                if r.status not in (405, 501):
+                    return r.status < 400
+            async with check_session.get(url, timeout=timeout, headers=_RANGE_HEADERS) as r:
+                return r.status < 400
+        except Exception:
+            return None
 
-def check_stream_worker(stream, stream_progress):
-    """Worker function to check a single stream - assumes already filtered"""
+def start_download_loop():
+    """Start the playlist download event loop in a background thread"""
+    global download_loop
+    download_loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    threading.Thread(target=download_loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(open_download_session(), download_loop).result()
+    if ASYNC_STREAM_CHECK:
+        asyncio.run_coroutine_threadsafe(open_check_session(), download_loop).result()
+
+def stop_download_loop():
+    """Close the shared session and stop the download event loop"""
+    if download_loop is None:
+        return
+    if session is not None:
+        asyncio.run_coroutine_threadsafe(session.close(), download_loop).result()
+    if check_session is not None:
+        asyncio.run_coroutine_threadsafe(check_session.close(), download_loop).result()
+    download_loop.call_soon_threadsafe(download_loop.stop)
+
+def check_stream_worker(stream, stream_progress, alive=None):
+    """Worker function to check a single stream - assumes already filtered
+    
+    alive: result of an async HEAD probe, if one answered (skips check_channel_status)
+    """
     if not IPTV_CHECKER_AVAILABLE:
         return None
     
@@ -977,24 +1173,20 @@ def check_stream_worker(stream, stream_progress):
     stream_url = stream['url']
     stream_key = f"{channel_name}_{stream_url}"
     
-    # Check if already processed (thread-safe)
-    with lock:
-        if stream_key in stream_progress:
-            result = stream_progress[stream_key]
-            with stats_lock:
-                global_stats['checked'] += 1
-                if result['status'] == 'working':
-                    global_stats['working'] += 1
-                else:
-                    global_stats['failed'] += 1
-            return result
-    
-    # Update status for display
-    with stats_lock:
-        global_stats['current_stream'] = channel_name
-        global_stats['last_status'] = 'checking'
-    
-    status = check_channel_status(stream_url, timeout=STREAM_TIMEOUT, extended_timeout=STREAM_TIMEOUT + 5)
+    # Check if already processed - single dict operations are atomic under the GIL, and the
+    # main thread submits each stream_key once, so no lock is needed
+    cached = stream_progress.get(stream_key)
+    if cached is not None:
+        return cached  # Counted by the caller like any result
+    
+    # Update status for display (plain stores, no lock needed)
+    global_stats['current_stream'] = channel_name
+    global_stats['last_status'] = 'checking'
+    
+    if alive is None:
+        status = check_channel_status(stream_url, timeout=STREAM_TIMEOUT, extended_timeout=STREAM_TIMEOUT + 5)
+    else:
+        status = 'Alive' if alive else 'Dead'
     if status == 'Alive':
         codec_name, video_bitrate, resolution, fps = get_detailed_stream_info(stream_url)
         audio_info = get_audio_bitrate(stream_url)
@@ -1028,59 +1220,84 @@ def check_stream_worker(stream, stream_progress):
             'channel_name': channel_name,
             'group_title': group_title,
             'expiry_date': expiry_date_str,
-            'checked_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'checked_at': timestamp_now()
         }
-        with stats_lock:
-            global_stats['checked'] += 1
-            global_stats['working'] += 1
-            global_stats['last_status'] = 'working'
+        global_stats['last_status'] = 'working'
     else:
         result = {
             'status': 'failed', 
             'reason': 'Stream not working',
             'channel_name': channel_name,
             'url': stream_url,
-            'checked_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'checked_at': timestamp_now()
         }
-        with stats_lock:
-            global_stats['checked'] += 1
-            global_stats['failed'] += 1
-            global_stats['last_status'] = 'failed'
+        global_stats['last_status'] = 'failed'
     
-    with lock:
-        stream_progress[stream_key] = result
-        # Also update global for graceful exit
-        global stream_progress_data
-        stream_progress_data[stream_key] = result
+    stream_progress[stream_key] = result
+    record_stream_result(stream_key, result)
     
     return result
 
+# Parenthesised tags and quality suffixes stripped to get a channel's base name. A run of
+# adjacent tags is one match, so it leaves a single space ('A HD (x) B' -> 'A B')
+CLEAN_RE = re.compile(r'\s*(?:(?:\([^)]*\)|\b(?:HD|FHD|4K|UHD|SD)\b)\s*)+', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=200_000)
+def channel_base_name(channel_name):
+    """Channel name without tags or quality suffixes (memoized, names repeat across mirrors)"""
+    return CLEAN_RE.sub(' ', channel_name).strip()
+
+class StreamOrganizer:
+    """Working streams grouped by (country, base name) and kept in bitrate order as they
+    arrive, so snapshots don't re-sort the whole list"""
+    def __init__(self):
+        self.groups = {}  # (country, base_name) -> [(-bitrate, seq, stream)], ascending
+        self.keys = []  # Sorted group keys
+        self.seq = 0  # Arrival order, keeps equal bitrates stable
+        self.lock = threading.Lock()  # Snapshots are taken from the background M3U writer
+        # id(stream) -> (final_name, encoded M3U entry). The organizer keeps every stream
+        # alive, so ids stay unique; kept off the stream dicts since those are saved as JSON
+        self.entries = {}
+    
+    def add(self, stream):
+        base_name = channel_base_name(stream['info']['channel_name'])
+        bitrate = extract_bitrate_value(stream.get('video_bitrate', '0'))
+        key = (stream['country'], base_name)
+        with self.lock:
+            channel_streams = self.groups.get(key)
+            if channel_streams is None:
+                channel_streams = self.groups[key] = []
+                bisect.insort(self.keys, key)
+            # seq is unique, so tuple comparison never reaches the stream dict
+            bisect.insort(channel_streams, (-bitrate, self.seq, stream))
+            self.seq += 1
+    
+    def organized(self):
+        """{country: [streams]} with final_name set (best bitrate first, then backups)"""
+        organized = {}
+        with self.lock:
+            for country, base_name in self.keys:
+                sorted_channels = organized.setdefault(country, [])
+                for idx, (_, _, stream) in enumerate(self.groups[(country, base_name)]):
+                    if idx == 0:
+                        stream['final_name'] = base_name
+                    else:
+                        stream['final_name'] = f"{base_name} backup {idx}"
+                    sorted_channels.append(stream)
+        return organized
+    
+    def encoded_entry(self, stream, country):
+        """M3U entry for an organized stream, re-rendered only when its final_name changes"""
+        cached = self.entries.get(id(stream))
+        if cached is None or cached[0] != stream['final_name']:
+            cached = self.entries[id(stream)] = (stream['final_name'], build_m3u_entry(stream, country))
+        return cached[1]
+
 def organize_streams_by_country_and_bitrate(working_streams):
-    by_country = defaultdict(list)
+    organizer = StreamOrganizer()
     for stream in working_streams:
-        country = stream['country']
-        by_country[country].append(stream)
-    organized = {}
-    for country, streams in by_country.items():
-        by_name = defaultdict(list)
-        for stream in streams:
-            channel_name = stream['info']['channel_name']
-            base_name = re.sub(r'\s*\(.*?\)\s*', '', channel_name)
-            base_name = re.sub(r'\s*(HD|FHD|4K|UHD|SD)\s*', '', base_name, flags=re.IGNORECASE)
-            base_name = base_name.strip()
-            by_name[base_name].append(stream)
-        sorted_channels = []
-        for base_name in sorted(by_name.keys()):
-            channel_streams = by_name[base_name]
-            channel_streams.sort(key=lambda s: extract_bitrate_value(s.get('video_bitrate', '0')), reverse=True)
-            for idx, stream in enumerate(channel_streams):
-                if idx == 0:
-                    stream['final_name'] = base_name
-                else:
-                    stream['final_name'] = f"{base_name} backup {idx}"
-            sorted_channels.extend(channel_streams)
-        organized[country] = sorted_channels
-    return organized
+        organizer.add(stream)
+    return organizer.organized()
 
 def get_earliest_expiry(streams):
     """Get the earliest expiry date from all streams"""
@@ -1089,118 +1306,373 @@ def get_earliest_expiry(streams):
         for stream in country_streams:
             expiry = stream.get('info', {}).get('expiry_date')
             if expiry:
+                # Entries loaded from progress files hold the date as an ISO string
+                if isinstance(expiry, str):
+                    try:
+                        expiry = datetime.fromisoformat(expiry)
+                    except ValueError:
+                        continue
                 expiry_dates.append(expiry)
     
     return min(expiry_dates) if expiry_dates else None
 
-def write_m3u_output(organized_streams, output_file, expiry_date=None, incremental=False):
+def build_extinf(stream, country):
+    """Build the #EXTINF line (with trailing newline) for an organized stream"""
+    info = stream['info']
+    tvg_id = f' tvg-id="{info["tvg_id"]}"' if info.get('tvg_id') else ''
+    tvg_name = f' tvg-name="{info["tvg_name"]}"' if info.get('tvg_name') else ''
+    tvg_logo = f' tvg-logo="{info["tvg_logo"]}"' if info.get('tvg_logo') else ''
+    # Get expiry date from stream data (check both root level and info dict)
+    stream_expiry = stream.get('expiry_date') or info.get('expiry_date')
+    expires = f" [Expires: {stream_expiry}]" if stream_expiry else ''
+    return (f'#EXTINF:-1{tvg_id}{tvg_name}{tvg_logo} group-title="{country}",'
+            f"{stream['final_name']} [{stream.get('resolution', 'Unknown')} {stream.get('video_bitrate', 'Unknown')}]{expires}\n")
+
+def build_m3u_entry(stream, country):
+    """Encoded #EXTINF and URL lines for an organized stream"""
+    return (build_extinf(stream, country) + stream['url'] + '\n').encode('utf-8')
+
+# Most buffers one writev call accepts (POSIX guarantees at least 16, Linux allows 1024)
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 16
+if IOV_MAX <= 0:
+    IOV_MAX = 16
+
+def write_chunks(path, chunks, sync=False):
+    """Write byte chunks to a new file, with vectored writes where the OS has them
+    
+    sync: fsync before closing, so a rename over the old file can't expose an empty one
+    """
+    if not hasattr(os, 'writev'):
+        with open(path, 'wb') as f:
+            f.write(b''.join(chunks))
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("#EXTM3U\n")
-            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("# Organized by country, alphabetically, and by bitrate\n")
-            if expiry_date:
-                f.write(f"# Subscription Expires: {expiry_date.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("\n")
-            for country in sorted(organized_streams.keys()):
-                streams = organized_streams[country]
-                f.write(f"\n# ===== {country} ({len(streams)} streams) =====\n")
-                for stream in streams:
-                    info = stream['info']
-                    final_name = stream['final_name']
-                    extinf = f"#EXTINF:-1"
-                    if info.get('tvg_id'):
-                        extinf += f' tvg-id="{info["tvg_id"]}"'
-                    if info.get('tvg_name'):
-                        extinf += f' tvg-name="{info["tvg_name"]}"'
-                    if info.get('tvg_logo'):
-                        extinf += f' tvg-logo="{info["tvg_logo"]}"'
-                    extinf += f' group-title="{country}"'
-                    resolution = stream.get('resolution', 'Unknown')
-                    video_bitrate = stream.get('video_bitrate', 'Unknown')
-                    name_with_info = f"{final_name} [{resolution} {video_bitrate}]"
-                    # Get expiry date from stream data (check both root level and info dict)
-                    stream_expiry = stream.get('expiry_date') or stream.get('info', {}).get('expiry_date')
-                    if stream_expiry:
-                        # It's already a string in YYYY-MM-DD format
-                        name_with_info += f" [Expires: {stream_expiry}]"
-                    extinf += f",{name_with_info}\n"
-                    f.write(extinf)
-                    f.write(stream['url'] + "\n")
+        for i in range(0, len(chunks), IOV_MAX):
+            batch = chunks[i:i + IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # Short write - finish the rest of the batch with plain writes
+                rest = memoryview(b''.join(batch))[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def replace_synced(temp_file, path):
+    """os.replace temp_file over path and fsync the directory, so the rename survives a crash"""
+    os.replace(temp_file, path)
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # No directory handles to sync (Windows)
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_m3u_output(organized_streams, output_file, expiry_date=None, incremental=False, entry=build_m3u_entry):
+    """entry: (stream, country) -> encoded entry, e.g. a StreamOrganizer's cached encoded_entry"""
+    try:
+        # Build the whole playlist in memory as bytes and hand it to the kernel in a few writev calls
+        header = ("#EXTM3U\n"
+                  f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                  "# Organized by country, alphabetically, and by bitrate\n")
+        if expiry_date:
+            header += f"# Subscription Expires: {expiry_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts = [(header + "\n").encode('utf-8')]
+        for country in sorted(organized_streams.keys()):
+            streams = organized_streams[country]
+            parts.append(f"\n# ===== {country} ({len(streams)} streams) =====\n".encode('utf-8'))
+            parts.extend(entry(stream, country) for stream in streams)
+        # Write to a per-thread temp file and swap it in, so readers (and the background
+        # snapshot writer) never see a partial file
+        temp_file = f"{output_file}.{threading.get_ident()}.tmp"
+        write_chunks(temp_file, parts, sync=not incremental)  # Snapshots are superseded anyway
+        os.replace(temp_file, output_file)
         if not incremental:
             print(f"\n{Colors.GREEN}[+] Output written to: {output_file}{Colors.RESET}")
     except Exception as e:
         if not incremental:
             print(f"\n{Colors.RED}[-] Error writing output: {e}{Colors.RESET}")
 
-def save_stream_progress(data):
-    with lock:
-        # Safety check: don't overwrite existing progress with empty data
-        if not data and os.path.exists(stream_progress_file):
-            try:
-                with open(stream_progress_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    if existing_data:
-                        # Silently refuse to overwrite - would disrupt display
-                        return
-            except:
-                pass  # If we can't read existing file, proceed with save
-        
-        temp_file = stream_progress_file + ".tmp"
+# Incremental M3U snapshots are written by a background thread so the checking loop never
+# waits on serialize/disk. The queue holds one request, so requests coalesce
+_m3u_writer_queue = queue.Queue(maxsize=1)
+_m3u_writer_state = {'organizer': None, 'thread': None}
+
+def _m3u_writer():
+    while True:
+        request = _m3u_writer_queue.get()
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            os.replace(temp_file, stream_progress_file)
+            if request is None:
+                return
+            organizer = _m3u_writer_state['organizer']
+            organized = organizer.organized()  # Latest state, not as of the request
+            expiry = get_earliest_expiry(organized)
+            write_m3u_output(organized, final_output_file, expiry, incremental=True, entry=organizer.encoded_entry)
         except Exception as e:
-            # Silently fail to avoid disrupting display - error logged to file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            if logger:
+                logger.log(f"[ERROR] Failed to write M3U: {e}\n", file_only=True)
+        finally:
+            _m3u_writer_queue.task_done()
+
+def request_m3u_snapshot(organizer):
+    """Ask the background writer to rewrite the M3U from a StreamOrganizer"""
+    _m3u_writer_state['organizer'] = organizer
+    if _m3u_writer_state['thread'] is None:
+        _m3u_writer_state['thread'] = threading.Thread(target=_m3u_writer, daemon=True)
+        _m3u_writer_state['thread'].start()
+    try:
+        _m3u_writer_queue.put_nowait(True)
+    except queue.Full:
+        pass  # A pending request will pick up this snapshot
+
+def stop_m3u_writer():
+    """Let the background writer finish any pending snapshot and exit"""
+    if _m3u_writer_state['thread'] is not None:
+        _m3u_writer_queue.put(None)
+        _m3u_writer_state['thread'].join()
+        _m3u_writer_state['thread'] = None
+
+def json_dumps(data):
+    """Serialize data to compact JSON bytes, using orjson when available (datetimes become ISO strings)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, default=str).encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON from bytes, using orjson when available"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+# Progress results are appended to JSONL journals as they come in; the JSON snapshots are
+# only rewritten (compacting the journal into them) once a journal has grown large
+JOURNAL_COMPACT_MIN = 1000  # entries
+_stream_journal = {'path': stream_journal_file, 'handle': None, 'entries': 0}
+_playlist_journal = {'path': playlist_journal_file, 'handle': None, 'entries': 0}
+
+def open_journal(journal, truncate=False):
+    """Open a progress journal for appending"""
+    try:
+        journal['handle'] = open(journal['path'], 'wb' if truncate else 'ab', buffering=1 << 16)
+    except Exception as e:
+        print(f"{Colors.YELLOW}[!] Could not open {journal['path']}: {e}{Colors.RESET}")
+
+def journal_append(journal, key, value):
+    """Append one progress entry to a journal (callers serialize access)"""
+    handle = journal['handle']
+    if handle is None:
+        return
+    try:
+        handle.write(json_dumps({'key': key, 'val': value}) + b'\n')
+        journal['entries'] += 1
+    except Exception:
+        pass
+
+def journal_flush(journal):
+    if journal['handle'] is not None:
+        try:
+            journal['handle'].flush()
+        except Exception:
+            pass
+
+def journal_reset(journal):
+    """Empty a journal once its entries are in the snapshot"""
+    if journal['handle'] is not None:
+        try:
+            journal['handle'].truncate(0)
+            # A 'wb' handle (reprocess runs) writes at its own offset, unlike O_APPEND - rewind
+            # it, or the next entry lands past a run of NUL bytes and fails to replay
+            journal['handle'].seek(0)
+        except Exception:
+            pass
+    journal['entries'] = 0
+
+def journal_needs_compaction(journal, snapshot_size):
+    return journal['entries'] >= max(snapshot_size, JOURNAL_COMPACT_MIN)
+
+def replay_journal(path, progress):
+    """Apply a journal's entries over a loaded snapshot (last write wins)"""
+    if not os.path.exists(path):
+        return progress
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                entry = json_loads(line)
+                progress[entry['key']] = entry['val']
+            except Exception:
+                continue  # Torn last line after a crash
+    return progress
+
+# Stream results reach the journal through one writer thread. Check workers only append
+# (key, result) deltas to a deque (append/popleft are atomic, no lock needed), and the writer
+# applies them to its own copy of stream progress, which is what gets compacted into the snapshot
+STREAM_WRITER_INTERVAL = 1.0  # Seconds between drains when no checkpoint is requested
+_stream_updates = collections.deque()
+_stream_writer_state = {'progress': None, 'thread': None, 'wake': threading.Event(),
+                        'compacted': threading.Event(), 'force_requests': 0, 'stop': False}
+
+def record_stream_result(stream_key, result):
+    """Queue a checked stream for the journal (called from check workers)"""
+    _stream_updates.append((stream_key, result))
+
+def _compact_stream_progress(progress):
+    """Rewrite the snapshot from the writer's copy of stream progress and empty the journal"""
+    # Safety check: don't overwrite existing progress with empty data
+    if not progress and os.path.exists(stream_progress_file):
+        try:
+            with open(stream_progress_file, 'rb') as f:
+                existing_data = json_loads(f.read())
+                if existing_data:
+                    # Silently refuse to overwrite - would disrupt display
+                    return
+        except:
+            pass  # If we can't read existing file, proceed with save
+    
+    temp_file = stream_progress_file + ".tmp"
+    try:
+        # The snapshot must be on disk before the journal is emptied - a crash in between
+        # would otherwise leave neither holding the progress
+        write_chunks(temp_file, [json_dumps(progress)], sync=True)
+        replace_synced(temp_file, stream_progress_file)
+        journal_reset(_stream_journal)
+    except Exception as e:
+        # Silently fail to avoid disrupting display - error logged to file
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+def _stream_progress_writer():
+    state = _stream_writer_state
+    progress = state['progress']
+    forced = 0  # force_requests handled so far (only save_stream_progress increments it)
+    while True:
+        state['wake'].wait(STREAM_WRITER_INTERVAL)
+        state['wake'].clear()
+        stopping = state['stop']
+        requested = state['force_requests']
+        while _stream_updates:
+            stream_key, result = _stream_updates.popleft()
+            progress[stream_key] = result
+            journal_append(_stream_journal, stream_key, result)
+        journal_flush(_stream_journal)
+        if requested > forced or journal_needs_compaction(_stream_journal, len(progress)):
+            _compact_stream_progress(progress)
+        if requested > forced:
+            forced = requested
+            state['compacted'].set()
+        if stopping:
+            return
+
+def start_stream_progress_writer(progress):
+    """Start the writer thread from the loaded stream progress
+    
+    The writer compacts from its own shallow copy, so the workers' dict is never serialized
+    while it changes. The copy shares the entry dicts and only costs a second hash table
+    (about 30-40 bytes per stream on 64-bit CPython)
+    """
+    _stream_writer_state['progress'] = dict(progress)
+    _stream_writer_state['stop'] = False
+    _stream_writer_state['thread'] = threading.Thread(target=_stream_progress_writer, daemon=True)
+    _stream_writer_state['thread'].start()
+
+def stop_stream_progress_writer():
+    """Let the writer drain pending results into the journal and exit"""
+    if _stream_writer_state['thread'] is not None:
+        _stream_writer_state['stop'] = True
+        _stream_writer_state['wake'].set()
+        _stream_writer_state['thread'].join()
+        _stream_writer_state['thread'] = None
+
+def save_stream_progress(force=False):
+    """Checkpoint stream progress: the writer flushes pending results to the journal and
+    compacts it into the snapshot once it outgrows the snapshot (force=True compacts now and waits)"""
+    state = _stream_writer_state
+    thread = state['thread']
+    if thread is None:
+        return
+    if force:
+        state['compacted'].clear()
+        state['force_requests'] += 1
+    state['wake'].set()
+    if force:
+        # Stop waiting if the writer exits without getting to the request (already stopping)
+        while not state['compacted'].wait(0.5) and thread.is_alive():
+            pass
 
 def load_stream_progress():
-    if not os.path.exists(stream_progress_file) or REPROCESS_STREAMS:
+    """Load the stream progress snapshot and replay its journal"""
+    if REPROCESS_STREAMS:
         return {}
+    progress = {}
     try:
-        with open(stream_progress_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if os.path.exists(stream_progress_file):
+            with open(stream_progress_file, 'rb') as f:
+                progress = json_loads(f.read())
     except Exception as e:
         print(f"{Colors.YELLOW}[!] Could not load stream progress: {e}{Colors.RESET}")
         return {}
+    progress = replay_journal(stream_journal_file, progress)
+    for entry in progress.values():
+        if isinstance(entry, dict):
+            intern_stream_fields(entry)
+    return progress
 
 def load_playlist_progress():
     """Load the list of already processed playlist URLs"""
-    if not os.path.exists(playlist_progress_file) or REPROCESS_PLAYLISTS:
+    if REPROCESS_PLAYLISTS:
         return {}
+    playlists = {}
     try:
-        with open(playlist_progress_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Support both old format (list) and new format (dict)
-            if 'playlists' in data:
-                return data['playlists']
-            elif 'processed_playlists' in data:
-                # Old format - convert to new format
-                return {url: {'status': 'processed', 'timestamp': data.get('last_updated', '')} 
-                        for url in data['processed_playlists']}
-            return {}
+        if os.path.exists(playlist_progress_file):
+            with open(playlist_progress_file, 'rb') as f:
+                data = json_loads(f.read())
+                # Support both old format (list) and new format (dict)
+                if 'playlists' in data:
+                    playlists = data['playlists']
+                elif 'processed_playlists' in data:
+                    # Old format - convert to new format
+                    playlists = {url: {'status': 'processed', 'timestamp': data.get('last_updated', '')} 
+                                 for url in data['processed_playlists']}
     except Exception as e:
         print(f"{Colors.YELLOW}[!] Could not load playlist progress: {e}{Colors.RESET}")
         return {}
+    return replay_journal(playlist_journal_file, playlists)
 
-def save_playlist_progress(processed_playlists_info):
-    """Save detailed playlist progress information"""
+def save_playlist_progress(processed_playlists_info, url=None, force=False):
+    """Record playlist progress: journal the entry for url (if given), and rewrite the
+    detailed snapshot once the journal outgrows it (or when force=True)"""
+    if url is not None:
+        journal_append(_playlist_journal, url, processed_playlists_info[url])
+    else:
+        journal_flush(_playlist_journal)  # Checkpoint - per-playlist appends stay buffered
+    if not force and not journal_needs_compaction(_playlist_journal, len(processed_playlists_info)):
+        return
+    temp_file = playlist_progress_file + ".tmp"
     try:
-        with open(playlist_progress_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'version': '2.0',
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'total_processed': len(processed_playlists_info),
-                'playlists': processed_playlists_info
-            }, f, indent=2)
+        data_bytes = json_dumps({
+            'version': '2.0',
+            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_processed': len(processed_playlists_info),
+            'playlists': processed_playlists_info
+        })
+        # Durable before the journal is emptied, as in _compact_stream_progress
+        write_chunks(temp_file, [data_bytes], sync=True)
+        replace_synced(temp_file, playlist_progress_file)
+        journal_reset(_playlist_journal)
     except Exception as e:
         # Silently fail to avoid disrupting display
         pass
 
 def graceful_exit(signum=None, frame=None):
     """Handle graceful exit - save progress and write output"""
+    _progress_state['stop'].set()  # Keep the renderer from drawing over the exit messages
     # Restore terminal cursor and clear display
     sys.stdout.write('\033[?25h')  # Show cursor
     sys.stdout.write('\n\n')
@@ -1208,45 +1680,39 @@ def graceful_exit(signum=None, frame=None):
     
     print(f"{Colors.YELLOW}[!] Interrupted! Saving progress...{Colors.RESET}")
     
-    # Save stream progress
-    global stream_progress_data, working_streams_data, processed_playlists_data
-    if stream_progress_data:
-        # Save directly without using the lock to avoid deadlock
-        temp_file = stream_progress_file + ".tmp"
+    # Save stream progress through the writer thread: it drains the pending results into the
+    # journal and compacts from its own copy, so nothing races the still-running check workers
+    if _stream_writer_state['thread'] is not None:
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(stream_progress_data, f, indent=2)
-            os.replace(temp_file, stream_progress_file)
-            print(f"{Colors.GREEN}[+] Stream progress saved ({len(stream_progress_data):,} streams){Colors.RESET}")
+            save_stream_progress(force=True)
+            stop_stream_progress_writer()
+            print(f"{Colors.GREEN}[+] Stream progress saved ({len(stream_progress):,} streams){Colors.RESET}")
         except Exception as e:
             print(f"{Colors.RED}[-] Error saving: {e}{Colors.RESET}")
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
     
     # Save playlist progress
-    if processed_playlists_data:
+    if processed_playlists:
         try:
-            save_playlist_progress(processed_playlists_data)
-            print(f"{Colors.GREEN}[+] Playlist progress saved ({len(processed_playlists_data):,} playlists){Colors.RESET}")
+            save_playlist_progress(processed_playlists, force=True)
+            print(f"{Colors.GREEN}[+] Playlist progress saved ({len(processed_playlists):,} playlists){Colors.RESET}")
         except Exception as e:
             print(f"{Colors.RED}[-] Error saving playlist progress: {e}{Colors.RESET}")
     
     # Write partial output if we have working streams
-    if working_streams_data:
+    if working_streams:
         print(f"{Colors.CYAN}→ Writing partial results to {final_output_file}...{Colors.RESET}")
         try:
-            organized = organize_streams_by_country_and_bitrate(working_streams_data)
+            organized = organize_streams_by_country_and_bitrate(working_streams)
             expiry = get_earliest_expiry(organized)
             write_m3u_output(organized, final_output_file, expiry)
-            print(f"{Colors.GREEN}[+] Partial results saved ({len(working_streams_data)} working streams){Colors.RESET}")
+            print(f"{Colors.GREEN}[+] Partial results saved ({len(working_streams)} working streams){Colors.RESET}")
         except Exception as e:
             print(f"{Colors.RED}[-] Error writing output: {e}{Colors.RESET}")
     
     print(f"{Colors.YELLOW}→ Exiting now{Colors.RESET}\n")
     sys.stdout.flush()
+    if logger:
+        logger.flush()  # os._exit skips file buffer cleanup
     os._exit(0)  # Force exit immediately without waiting for threads
 
 if __name__ == '__main__':
@@ -1266,13 +1732,14 @@ if __name__ == '__main__':
     ENABLE_FILTERS = not args.no_filters
     INCLUDE_RADIO = args.include_radio
     INCLUDE_ADULT = args.include_adult
+    ASYNC_STREAM_CHECK = args.async_check
     
     # Build filter patterns based on flags
     build_filter_patterns()
     
     # Clear progress if requested
     if args.clear_progress:
-        for progress_file in [stream_progress_file, playlist_progress_file]:
+        for progress_file in [stream_progress_file, stream_journal_file, playlist_progress_file, playlist_journal_file]:
             if os.path.exists(progress_file):
                 os.remove(progress_file)
                 print(f"{Colors.YELLOW}[+] Cleared {progress_file}{Colors.RESET}")
@@ -1325,13 +1792,13 @@ if __name__ == '__main__':
     
     # Load stream progress
     stream_progress = load_stream_progress()
-    stream_progress_data = stream_progress  # Reference the same dict for graceful exit
+    open_journal(_stream_journal, truncate=REPROCESS_STREAMS)
     logger.log(f"{Colors.BOLD}{Colors.BLUE}→ Loading previous stream progress...{Colors.RESET}\n")
     logger.log(f"{Colors.CYAN}  Loaded {len(stream_progress)} previously checked streams{Colors.RESET}\n\n")
     
     # Load playlist progress
     processed_playlists = load_playlist_progress()
-    processed_playlists_data = processed_playlists  # For graceful exit
+    open_journal(_playlist_journal, truncate=REPROCESS_PLAYLISTS)
     logger.log(f"{Colors.BOLD}{Colors.BLUE}→ Loading previous playlist progress...{Colors.RESET}\n")
     logger.log(f"{Colors.CYAN}  Loaded {len(processed_playlists)} previously processed playlists{Colors.RESET}\n")
     
@@ -1345,7 +1812,6 @@ if __name__ == '__main__':
     elif REPROCESS_PLAYLISTS:
         logger.log(f"{Colors.YELLOW}  REPROCESS_PLAYLISTS=True: Re-checking all playlists{Colors.RESET}\n\n")
         processed_playlists = {}  # Clear the dict to track fresh
-        processed_playlists_data = processed_playlists
     else:
         logger.log(f"{Colors.GREEN}  All {len(playlist_urls):,} playlists need processing{Colors.RESET}\n\n")
     
@@ -1357,13 +1823,13 @@ if __name__ == '__main__':
     
     # Save initial progress state
     logger.log(f"{Colors.BOLD}{Colors.BLUE}→ Saving initial progress state...{Colors.RESET}\n")
-    save_stream_progress(stream_progress)
+    start_stream_progress_writer(stream_progress)
+    save_stream_progress(force=True)  # Compacts any journal left by a previous run
     logger.log(f"{Colors.GREEN}[+] Progress saved{Colors.RESET}\n\n")
     
     # Initialize stats
-    with stats_lock:
-        global_stats['start_time'] = time.time()
-        global_stats['total_m3u'] = len(playlist_urls)
+    global_stats['start_time'] = time.time()
+    global_stats['total_m3u'] = len(playlist_urls)
     
     logger.log(f"{Colors.BOLD}{Colors.BLUE}→ Starting playlist extraction...{Colors.RESET}\n")
     logger.log(f"  Playlists to process: {len(playlist_urls):,}\n")
@@ -1376,6 +1842,7 @@ if __name__ == '__main__':
     
     # Rebuild working_streams from previously checked streams
     working_streams = []
+    stream_organizer = StreamOrganizer()  # working_streams, organized as they are added
     if stream_progress:
         logger.log(f"{Colors.CYAN}→ Rebuilding working streams from progress...{Colors.RESET}\n")
         updated_count = 0
@@ -1391,21 +1858,20 @@ if __name__ == '__main__':
                         updated_count += 1
                 
                 working_streams.append(stream_data)
+                stream_organizer.add(stream_data)
         logger.log(f"{Colors.GREEN}  Loaded {len(working_streams):,} previously working streams{Colors.RESET}\n")
-        logger.log(f"{Colors.GRAY}  (Stream keys sample: {list(stream_progress.keys())[:3]}...){Colors.RESET}\n", file_only=True)
+        logger.log(f"{Colors.GRAY}  (Stream keys sample: {list(itertools.islice(stream_progress, 3))}...){Colors.RESET}\n", file_only=True)
         if updated_count > 0:
             logger.log(f"{Colors.YELLOW}  Updated country codes for {updated_count} streams{Colors.RESET}\n")
         logger.log("\n")
-        
-        # Sync working_streams_data with loaded streams for graceful_exit
-        working_streams_data = working_streams.copy()
-        logger.log(f"{Colors.GRAY}  Synced working_streams_data: {len(working_streams_data)} streams{Colors.RESET}\n", file_only=True)
     else:
         logger.log(f"{Colors.YELLOW}  No previous stream progress found{Colors.RESET}\n\n")
     
     all_streams_count = 0
     save_counter = 0
     processed_count = 0
+    last_m3u_snapshot = 0.0  # time.monotonic() of the last M3U snapshot request
+    last_m3u_count = 0  # len(working_streams) at that request - unchanged means identical output
     
     # Reserve space for progress bars (11 lines: 8 for bars + 3 for M3U/CHK/status)
     for _ in range(11):
@@ -1414,33 +1880,148 @@ if __name__ == '__main__':
     # Display initial progress (this will move cursor back up and print)
     update_dual_progress(0, len(playlist_urls), parse_start_time, "")
     
-    # Process playlists with BOTH parallel downloading AND sequential stream checking
-    with ThreadPoolExecutor(max_workers=MAX_PLAYLIST_WORKERS) as playlist_executor, \
-         ThreadPoolExecutor(max_workers=MAX_STREAM_WORKERS) as stream_executor:
+    # Process playlists with BOTH parallel downloading AND parallel stream checking
+    # Playlist downloads are coroutines on the background event loop; stream checks use threads.
+    # Checks from every downloaded playlist share the stream pool, so one slow stream no longer
+    # holds back the next playlist - a playlist completes when its last check comes back
+    start_download_loop()
+    
+    def finish_playlist(url):
+        """Mark a playlist whose stream checks have all come back as processed"""
+        global processed_count, last_m3u_snapshot, last_m3u_count
+        job = playlist_jobs.pop(url)
+        processed_count += 1
         
-        last_update_time = time.time()
+        # Mark this playlist as processed with details
+        processed_playlists[url] = {
+            'status': 'completed',
+            'timestamp': timestamp_now(),
+            'streams_found': job['original_count'],
+            'streams_filtered': job['filtered_out_count'],
+            'streams_checked': job['streams_checked'],
+            'working_streams': job['working'],
+            'url': url
+        }
+        
+        # Log completion details
+        logger.log(f"[DONE] Playlist {processed_count}/{len(playlist_urls)} completed\n", file_only=True)
+        logger.log(f"       Working: {job['working']}/{job['streams_checked']} streams\n", file_only=True)
+        
+        # Final update after all streams from this playlist are done
+        done_msg = f"{Colors.GREEN}[+] Playlist {processed_count}/{len(playlist_urls)} complete - {job['working']} working{Colors.RESET}"
+        update_dual_progress(processed_count, len(playlist_urls), parse_start_time, done_msg, url)
+        
+        # Journal the playlist (buffered - the periodic checkpoint flushes it; the stream
+        # writer drains its own results every STREAM_WRITER_INTERVAL)
+        save_playlist_progress(processed_playlists, url)
         
-        # Submit playlists in batches for parallel downloading
-        playlist_batch_size = MAX_PLAYLIST_WORKERS * 2  # Download 2x workers at a time
+        # Rewrite the M3U at most every M3U_SNAPSHOT_INTERVAL seconds while playlists complete
+        now = time.monotonic()
+        if len(working_streams) != last_m3u_count and now - last_m3u_snapshot >= M3U_SNAPSHOT_INTERVAL:
+            last_m3u_snapshot = now
+            last_m3u_count = len(working_streams)
+            request_m3u_snapshot(stream_organizer)
+            save_msg = f"{Colors.GREEN}[S] M3U updated: {len(working_streams)} working streams{Colors.RESET}"
+            update_dual_progress(processed_count, len(playlist_urls), parse_start_time, save_msg, url)
+            logger.log(f"[SAVE] M3U file updated with {len(working_streams)} streams\n", file_only=True)
+    
+    def submit_stream_checks(streams_to_check, alive_map):
+        """Hand unchecked streams to the stream pool"""
+        for stream_key, stream in streams_to_check.items():
+            stream_future = stream_executor.submit(check_stream_worker, stream, stream_progress,
+                                                   alive_map.get(stream['url']))
+            pending_streams[stream_future] = stream_key
+            stream_future.add_done_callback(completed_futures.put)
+    
+    with ThreadPoolExecutor(max_workers=MAX_STREAM_WORKERS) as stream_executor:
+        
+        # The clock is only read every CLOCK_CHECK_EVERY completions (and when checks start or
+        # drain), not once per completed future
+        CLOCK_CHECK_EVERY = 32
+        completion_count = 0
+        last_save_time = time.monotonic()  # Track when we last saved
+        
+        # Keep a sliding window of playlist downloads in flight, so the next playlists
+        # download while earlier ones' streams are being checked
+        playlist_window = MAX_PLAYLIST_WORKERS * 2  # Downloads in flight (2x workers)
+        stream_backlog = MAX_STREAM_WORKERS * 20  # Stop downloading ahead while this many checks/probes are queued
         playlist_index = 0
+        pending_downloads = {}   # future -> (url, idx)
+        pending_probes = {}      # future -> (stream url, {stream_key: stream} sharing it)
+        pending_streams = {}     # future -> stream_key
+        stream_waiters = {}      # stream_key -> playlist urls waiting on its check (first one submitted it)
+        playlist_jobs = {}       # url -> counters for a playlist with checks in flight
+        completed_futures = queue.Queue()  # Every future reports here when done
+        stream_check_busy = 0.0  # Time with stream checks in flight, excluding the current stretch
+        stream_check_start = None
         
-        while playlist_index < len(playlist_urls):
-            # Submit a batch of playlists for downloading
-            batch_end = min(playlist_index + playlist_batch_size, len(playlist_urls))
-            batch_futures = {}
+        while playlist_index < len(playlist_urls) or pending_downloads or pending_probes or pending_streams:
+            # Top up the download window
+            while (playlist_index < len(playlist_urls) and len(pending_downloads) < playlist_window
+                   and len(pending_streams) + len(pending_probes) < stream_backlog):
+                url = playlist_urls[playlist_index]
+                future = asyncio.run_coroutine_threadsafe(download_playlist_wrapper(url, playlist_index + 1, len(playlist_urls)), download_loop)
+                pending_downloads[future] = (url, playlist_index + 1)
+                future.add_done_callback(completed_futures.put)
+                playlist_index += 1
+            
+            future = completed_futures.get()
+            
+            if future in pending_streams:
+                # A stream check came back - credit every playlist waiting on it
+                stream_key = pending_streams.pop(future)
+                result = None
+                try:
+                    result = future.result()
+                except Exception as e:
+                    pass
+                
+                waiting_urls = stream_waiters.pop(stream_key)
+                if result and result['status'] == 'working':
+                    working_streams.append(result)
+                    stream_organizer.add(result)
+                    logger.log(f"{Colors.GRAY}  DEBUG: Added working stream '{result.get('channel_name', 'Unknown')[:40]}' (total now: {len(working_streams)}){Colors.RESET}\n", file_only=True)
+                
+                if result:
+                    # Count the check once for every playlist that had the stream
+                    global_stats['checked'] += len(waiting_urls)
+                    if result['status'] == 'working':
+                        global_stats['working'] += len(waiting_urls)
+                    else:
+                        global_stats['failed'] += len(waiting_urls)
+                
+                for url in waiting_urls:
+                    job = playlist_jobs[url]
+                    if result and result['status'] == 'working':
+                        job['working'] += 1  # Increment counter for this playlist
+                        # Log working stream details
+                        if job['done'] % 50 == 0:  # Log every 50 working streams
+                            logger.log(f"[WORK] {result.get('channel_name', 'Unknown')} - {result.get('resolution', 'N/A')} @ {result.get('video_bitrate', 'N/A')}\n", file_only=True)
+                    job['done'] += 1
+                    
+                    # Update progress display every 8 streams (the renderer thread limits redraws)
+                    if not job['done'] & 0x7 or job['done'] == job['total']:
+                        update_dual_progress(processed_count, len(playlist_urls), parse_start_time, "", url, current_playlist_streams=(job['done'], job['total']), original_playlist_total=job['original_count'])
+                    
+                    if job['done'] == job['total']:
+                        finish_playlist(url)
             
-            for idx in range(playlist_index, batch_end):
-                url = playlist_urls[idx]
-                future = playlist_executor.submit(download_playlist_wrapper, url, idx + 1, len(playlist_urls))
-                batch_futures[future] = (url, idx + 1)
+            elif future in pending_probes:
+                # A liveness probe is in - ffprobe only runs on live streams, and starts
+                # without waiting for the rest of the playlist's probes. A probe that got no
+                # answer (None) is not a failure: those streams get the full check instead
+                stream_url, streams_to_check = pending_probes.pop(future)
+                try:
+                    alive_map = {stream_url: future.result()}
+                except Exception as e:
+                    alive_map = {}  # Fall back to the full check
+                submit_stream_checks(streams_to_check, alive_map)
             
-            # Process each downloaded playlist as it completes
-            for future in as_completed(batch_futures.keys()):
-                url, idx = batch_futures[future]
+            else:
+                url, idx = pending_downloads.pop(future)
                 
                 # Update current M3U URL being processed
-                with stats_lock:
-                    global_stats['current_m3u'] = url
+                global_stats['current_m3u'] = url
                 
                 try:
                     streams, download_time = future.result()
@@ -1449,25 +2030,21 @@ if __name__ == '__main__':
                     original_count = len(streams)
                     filtered_streams = []
                     filtered_out_count = 0
+                    now = datetime.now()  # One clock read per playlist, not per stream
                     
                     for stream in streams:
-                        channel_name = stream['info']['channel_name']
-                        group_title = stream['info']['group_title']
-                        expiry_date = stream['info'].get('expiry_date')
+                        info = stream['info']
+                        expiry_date = info['expiry_date']
                         
                         # Filter by content type
-                        if should_filter_stream(channel_name, group_title):
+                        if should_filter_stream(info['channel_name'], info['group_title']):
                             filtered_out_count += 1
-                            with stats_lock:
-                                global_stats['filtered'] += 1
                         # Filter by expiry date (filter out streams expiring in LESS than 30 days)
                         elif expiry_date:
-                            days_until_expiry = (expiry_date - datetime.now()).days
+                            days_until_expiry = (expiry_date - now).days
                             if days_until_expiry < 30:
                                 # Filter out streams that expire soon (less than 30 days)
                                 filtered_out_count += 1
-                                with stats_lock:
-                                    global_stats['filtered'] += 1
                             else:
                                 # Keep streams expiring in 30+ days
                                 filtered_streams.append(stream)
@@ -1475,13 +2052,13 @@ if __name__ == '__main__':
                             # No expiry date - keep the stream
                             filtered_streams.append(stream)
                     
-                    # Update M3U stats
-                    with stats_lock:
-                        global_stats['total_streams'] += original_count
-                        if original_count > 0:
-                            global_stats['valid_m3u'] += 1
-                        else:
-                            global_stats['invalid_m3u'] += 1
+                    # Update M3U stats (only the main thread writes these, no lock needed)
+                    global_stats['total_streams'] += original_count
+                    global_stats['filtered'] += filtered_out_count
+                    if original_count > 0:
+                        global_stats['valid_m3u'] += 1
+                    else:
+                        global_stats['invalid_m3u'] += 1
                     
                     # Show result with filtering info
                     if filtered_streams:
@@ -1494,24 +2071,23 @@ if __name__ == '__main__':
                         # Mark as processed even if all streams filtered
                         processed_playlists[url] = {
                             'status': 'all_filtered',
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                            'timestamp': timestamp_now(),
                             'streams_found': original_count,
                             'streams_filtered': original_count,
                             'streams_checked': 0,
                             'working_streams': 0,
                             'url': url
                         }
-                        processed_playlists_data[url] = processed_playlists[url]
                         processed_count += 1
                         # Save progress for filtered playlists immediately
-                        save_playlist_progress(processed_playlists)
+                        save_playlist_progress(processed_playlists, url)
                     else:
                         status_msg = f"{Colors.RED}[-] [{idx}/{len(playlist_urls)}] Empty or timeout ({download_time:.1f}s){Colors.RESET}"
                         logger.log(f"[ERROR] Playlist {idx}/{len(playlist_urls)}: Empty or timeout - {url}\n", file_only=True)
                         # Mark invalid/empty playlists as processed so they won't be retried
                         processed_playlists[url] = {
                             'status': 'invalid',
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                            'timestamp': timestamp_now(),
                             'streams_found': 0,
                             'streams_filtered': 0,
                             'streams_checked': 0,
@@ -1519,127 +2095,75 @@ if __name__ == '__main__':
                             'reason': 'empty_or_timeout',
                             'url': url
                         }
-                        processed_playlists_data[url] = processed_playlists[url]
                         processed_count += 1
                         # Save progress for invalid playlists immediately
-                        save_playlist_progress(processed_playlists)
+                        save_playlist_progress(processed_playlists, url)
                     update_dual_progress(processed_count, len(playlist_urls), parse_start_time, status_msg, url)
                     
-                    # Initialize counter for tracking working streams from this playlist
-                    working_count_this_playlist = 0
-                    
-                    # If playlist has streams AFTER filtering, CHECK THEM ALL before continuing
-                    if filtered_streams:
-                        # Track time spent checking streams
-                        stream_check_start = time.time()
-                        
-                        # Submit only non-filtered streams for checking
-                        stream_futures = {}
-                        for stream in filtered_streams:
-                            stream_future = stream_executor.submit(check_stream_worker, stream, stream_progress)
-                            stream_futures[stream_future] = stream
-                        
-                        # Wait for all streams from this playlist to be checked
-                        stream_count = 0
-                        last_save_time = time.time()  # Track when we last saved
-                        
-                        for sf in as_completed(stream_futures.keys()):
-                            try:
-                                result = sf.result()
-                                if result and result['status'] == 'working':
-                                    working_streams.append(result)
-                                    working_streams_data.append(result)
-                                    working_count_this_playlist += 1  # Increment counter for this playlist
-                                    logger.log(f"{Colors.GRAY}  DEBUG: Added working stream '{result.get('channel_name', 'Unknown')[:40]}' (total now: {len(working_streams)}){Colors.RESET}\n", file_only=True)
-                                    # Log working stream details
-                                    if stream_count % 50 == 0:  # Log every 50 working streams
-                                        logger.log(f"[WORK] {result.get('channel_name', 'Unknown')} - {result.get('resolution', 'N/A')} @ {result.get('video_bitrate', 'N/A')}\n", file_only=True)
-                            except Exception as e:
-                                pass
-                            
-                            stream_count += 1
-                            
-                            # Update progress display every second
-                            current_time = time.time()
-                            if stream_count % 10 == 0 or stream_count == len(stream_futures) or (current_time - last_update_time) >= 1.0:
-                                # Update stream checking time continuously
-                                with stats_lock:
-                                    global_stats['stream_checking_time'] = time.time() - stream_check_start
-                                update_dual_progress(processed_count, len(playlist_urls), parse_start_time, "", url, current_playlist_streams=(stream_count, len(stream_futures)), original_playlist_total=original_count)
-                                last_update_time = current_time
-                            
-                            # Auto-save progress every SAVE_INTERVAL seconds during stream checking
-                            if current_time - last_save_time >= SAVE_INTERVAL:
-                                logger.log(f"{Colors.GRAY}  DEBUG: Saving progress - stream_progress has {len(stream_progress)} streams, stream_progress_data has {len(stream_progress_data)} streams{Colors.RESET}\n", file_only=True)
-                                save_stream_progress(stream_progress)
-                                save_playlist_progress(processed_playlists)
-                                # Also write incremental M3U if we have working streams
-                                if working_streams:
-                                    try:
-                                        organized_temp = organize_streams_by_country_and_bitrate(working_streams)
-                                        expiry = get_earliest_expiry(organized_temp)
-                                        write_m3u_output(organized_temp, final_output_file, expiry, incremental=True)
-                                    except Exception:
-                                        pass
-                                last_save_time = current_time
-                        
-                        # Set final stream checking time (already being tracked continuously)
-                        stream_check_elapsed = time.time() - stream_check_start
-                        with stats_lock:
-                            global_stats['stream_checking_time'] = stream_check_elapsed
-                    
-                    # Increment processed count after all streams are done
-                    processed_count += 1
-                    
-                    # Mark this playlist as processed with details
-                    processed_playlists[url] = {
-                        'status': 'completed',
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'streams_found': original_count,
-                        'streams_filtered': filtered_out_count,
+                    # Counters for tracking this playlist until its last stream check is back
+                    job = {
+                        'original_count': original_count,
+                        'filtered_out_count': filtered_out_count,
                         'streams_checked': len(filtered_streams),
-                        'working_streams': working_count_this_playlist,
-                        'url': url
+                        'working': 0,
+                        'done': 0,
+                        'total': 0
                     }
-                    processed_playlists_data[url] = processed_playlists[url]
+                    playlist_jobs[url] = job
                     
-                    # Log completion details
-                    logger.log(f"[DONE] Playlist {processed_count}/{len(playlist_urls)} completed\n", file_only=True)
-                    logger.log(f"       Working: {working_count_this_playlist}/{len(filtered_streams)} streams\n", file_only=True)
-                    
-                    # Final update after all streams from this playlist are done
-                    done_msg = f"{Colors.GREEN}[+] Playlist {processed_count}/{len(playlist_urls)} complete - {working_count_this_playlist} working{Colors.RESET}"
-                    update_dual_progress(processed_count, len(playlist_urls), parse_start_time, done_msg, url)
-                    
-                    # Save progress after EVERY playlist
-                    save_stream_progress(stream_progress)
-                    save_playlist_progress(processed_playlists)
+                    # Streams already checked (previous run or earlier playlist) never reach the pool -
+                    # working ones are already in working_streams. Streams another playlist is still
+                    # checking are waited on, and duplicates within the playlist are checked once
+                    streams_to_check = {}
+                    cached_working = cached_failed = 0
+                    for stream in filtered_streams:
+                        stream_key = f"{stream['info']['channel_name']}_{stream['url']}"
+                        cached = stream_progress.get(stream_key)
+                        if cached is None:
+                            if stream_key in streams_to_check:
+                                continue
+                            waiters = stream_waiters.get(stream_key)
+                            if waiters is None:
+                                streams_to_check[stream_key] = stream
+                                stream_waiters[stream_key] = [url]
+                            else:
+                                waiters.append(url)
+                            job['total'] += 1
+                        elif cached.get('status') == 'working':
+                            cached_working += 1
+                        else:
+                            cached_failed += 1
+                    if cached_working or cached_failed:
+                        global_stats['checked'] += cached_working + cached_failed
+                        global_stats['working'] += cached_working
+                        global_stats['failed'] += cached_failed
+                        job['working'] += cached_working
                     
-                    # Write M3U file whenever we have working streams (every 1 playlist if streams found)
-                    # or at least every 5 playlists to show progress
-                    should_write = (len(working_streams) > 0 and processed_count % 1 == 0) or processed_count % 5 == 0
+                    if streams_to_check:
+                        # Probe liveness of unchecked streams concurrently, ffprobe only runs on live ones
+                        if ASYNC_STREAM_CHECK and IPTV_CHECKER_AVAILABLE:
+                            by_url = {}
+                            for stream_key, stream in streams_to_check.items():
+                                by_url.setdefault(stream['url'], {})[stream_key] = stream
+                            for stream_url, url_streams in by_url.items():
+                                probe_future = asyncio.run_coroutine_threadsafe(check_alive(stream_url), download_loop)
+                                pending_probes[probe_future] = (stream_url, url_streams)
+                                probe_future.add_done_callback(completed_futures.put)
+                        else:
+                            submit_stream_checks(streams_to_check, {})
                     
-                    if should_write and working_streams:
-                        try:
-                            organized_temp = organize_streams_by_country_and_bitrate(working_streams)
-                            expiry = get_earliest_expiry(organized_temp)
-                            write_m3u_output(organized_temp, final_output_file, expiry, incremental=True)
-                            # Show notification every 10 playlists
-                            if processed_count % 10 == 0:
-                                save_msg = f"{Colors.GREEN}[S] M3U updated: {len(working_streams)} working streams{Colors.RESET}"
-                                update_dual_progress(processed_count, len(playlist_urls), parse_start_time, save_msg, url)
-                                logger.log(f"[SAVE] M3U file updated with {len(working_streams)} streams\n", file_only=True)
-                        except Exception as e:
-                            logger.log(f"[ERROR] Failed to write M3U: {e}\n", file_only=True)
+                    if job['total'] == 0:
+                        finish_playlist(url)
                     
                 except KeyboardInterrupt:
                     print(f"\n\n{Colors.YELLOW}[!] Interrupted by user{Colors.RESET}")
                     graceful_exit()
                 except Exception as e:
+                    playlist_jobs.pop(url, None)
                     # Mark failed playlists as processed so they won't be retried
                     processed_playlists[url] = {
                         'status': 'error',
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        'timestamp': timestamp_now(),
                         'streams_found': 0,
                         'streams_filtered': 0,
                         'streams_checked': 0,
@@ -1647,16 +2171,41 @@ if __name__ == '__main__':
                         'error': str(e) if e else 'Unknown error',
                         'url': url
                     }
-                    processed_playlists_data[url] = processed_playlists[url]
                     processed_count += 1
                     # Save progress for failed playlists
-                    save_playlist_progress(processed_playlists)
-                    with stats_lock:
-                        global_stats['invalid_m3u'] += 1
+                    save_playlist_progress(processed_playlists, url)
+                    global_stats['invalid_m3u'] += 1
                     pass  # Continue with next playlist
             
-            # Move to next batch
-            playlist_index = batch_end
+            completion_count += 1
+            checks_in_flight = bool(pending_streams or pending_probes)
+            if completion_count % CLOCK_CHECK_EVERY and checks_in_flight == (stream_check_start is not None):
+                continue
+            
+            # Track time spent with stream checks in flight (excluded from the playlist ETA)
+            current_time = time.monotonic()
+            if checks_in_flight:
+                if stream_check_start is None:
+                    stream_check_start = current_time
+                global_stats['stream_checking_time'] = stream_check_busy + (current_time - stream_check_start)
+            elif stream_check_start is not None:
+                stream_check_busy += current_time - stream_check_start
+                stream_check_start = None
+                global_stats['stream_checking_time'] = stream_check_busy
+            
+            # Auto-save progress every SAVE_INTERVAL seconds during stream checking
+            if current_time - last_save_time >= SAVE_INTERVAL:
+                logger.log(f"{Colors.GRAY}  DEBUG: Saving progress - stream_progress has {len(stream_progress)} streams{Colors.RESET}\n", file_only=True)
+                save_stream_progress()
+                save_playlist_progress(processed_playlists)
+                # Also write incremental M3U if working streams were added since the last one
+                if len(working_streams) != last_m3u_count:
+                    last_m3u_count = len(working_streams)
+                    request_m3u_snapshot(stream_organizer)
+                last_save_time = current_time
+    stop_download_loop()
+    stop_m3u_writer()
+    stop_progress_renderer()
     
     # Clear the progress display and move to bottom
     sys.stdout.write('\033[9B')  # Move down past progress bars
@@ -1675,10 +2224,15 @@ if __name__ == '__main__':
     logger.log(f"  Working streams: {global_stats['working']:,}\n")
     logger.log(f"  Failed streams: {global_stats['failed']:,}\n")
     logger.log(f"  Filtered streams: {global_stats['filtered']:,}\n\n")
+    logger.log(f"  Filter cache: {filter_matches.cache_info()}\n", file_only=True)
+    logger.log(f"  Country cache: {extract_country_code.cache_info()}\n", file_only=True)
+    logger.log(f"  TVG-ID country cache: {extract_country_from_tvg_id.cache_info()}\n", file_only=True)
+    logger.log(f"  EXTINF cache: {parse_channel_fields.cache_info()}\n\n", file_only=True)
     
     logger.log(f"\n{Colors.CYAN}[>] Saving final progress...{Colors.RESET}\n")
-    save_stream_progress(stream_progress)
-    save_playlist_progress(processed_playlists)
+    save_stream_progress(force=True)
+    stop_stream_progress_writer()
+    save_playlist_progress(processed_playlists, force=True)
     logger.log(f"{Colors.GREEN}[+] Progress saved{Colors.RESET}\n\n")
     
     if not working_streams:
@@ -1690,12 +2244,12 @@ if __name__ == '__main__':
     logger.log(f"{Colors.GRAY}  DEBUG: Sample channel names: {[s.get('channel_name', 'Unknown')[:30] for s in working_streams[:5]]}{Colors.RESET}\n", file_only=True)
     
     logger.log(f"\n{Colors.BOLD}{Colors.BLUE}[>] Organizing streams by country and bitrate...{Colors.RESET}\n")
-    organized = organize_streams_by_country_and_bitrate(working_streams)
+    organized = stream_organizer.organized()
     total_organized = sum(len(streams) for streams in organized.values())
     logger.log(f"{Colors.GREEN}[+] Organized {total_organized} working streams across {len(organized)} countries{Colors.RESET}\n\n")
     logger.log(f"{Colors.BOLD}{Colors.BLUE}[>] Writing output file...{Colors.RESET}\n")
     expiry = get_earliest_expiry(organized)
-    write_m3u_output(organized, final_output_file, expiry)
+    write_m3u_output(organized, final_output_file, expiry, entry=stream_organizer.encoded_entry)
     elapsed = time.time() - global_stats['start_time']
     logger.log(f"\n{Colors.BOLD}{Colors.GREEN}{'═' * 78}{Colors.RESET}\n")
     logger.log(f"{Colors.BOLD}{Colors.GREEN}{'  ' * 15}[+] PROCESSING COMPLETE [+]{'  ' * 15}{Colors.RESET}\n")